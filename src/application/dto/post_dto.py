@@ -8,6 +8,18 @@ from dataclasses import dataclass
 from ...domain.entities.post import Post
 
 
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse an ISO date string with date.fromisoformat, accepting full datetime strings too"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
 @dataclass
 class PostDTO:
     """
@@ -51,13 +63,7 @@ class PostDTO:
             Post: Domain entity
         """
         # Parse date from ISO string
-        post_date = None
-        if dto.date:
-            try:
-                post_date = datetime.fromisoformat(dto.date).date()
-            except ValueError:
-                # Fallback for other date formats
-                post_date = None
+        post_date = _parse_iso_date(dto.date) if dto.date else None
 
         return Post(
             title=dto.title,
@@ -107,12 +113,9 @@ class WatchResultDTO:
         filtered_posts = []
         for post in self.posts:
             if post.date:
-                try:
-                    post_date = datetime.fromisoformat(post.date).date()
-                    if start_date <= post_date <= end_date:
-                        filtered_posts.append(post)
-                except ValueError:
-                    continue
+                post_date = _parse_iso_date(post.date)
+                if post_date and start_date <= post_date <= end_date:
+                    filtered_posts.append(post)
         return filtered_posts
 
 
@@ -236,11 +239,8 @@ class ResultDTO:
         filtered_posts = []
         for post in self.posts:
             if post.date:
-                try:
-                    post_date = datetime.fromisoformat(post.date).date()
-                    if start_date <= post_date <= end_date:
-                        filtered_posts.append(post)
-                except ValueError:
-                    continue
+                post_date = _parse_iso_date(post.date)
+                if post_date and start_date <= post_date <= end_date:
+                    filtered_posts.append(post)
         return filtered_posts
 
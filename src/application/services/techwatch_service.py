@@ -3,13 +3,18 @@ Technology Watch Service - Application Layer
 Hexagonal Architecture DDD
 """
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...domain.entities.post import Post
 from ...domain.value_objects.date_range import DateRange
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on crawlers fetched concurrently by run()
+MAX_CRAWL_WORKERS = 16
+
 
 class TechWatchService:
     """Main service orchestrating technology watch - Application Layer"""
@@ -20,6 +25,8 @@ class TechWatchService:
         # Delayed import to avoid circular imports
         from ...infrastructure.services.fallback_service import FallbackVerificationService
         self.fallback_service = FallbackVerificationService()
+        # Sources that succeeded/failed during the last fetch_posts_in_range() call
+        self.last_fetch_stats = {'sources_success': 0, 'sources_failed': 0}
 
     def run(self, days_back: int = 0) -> None:
         """Execute technology watch on all crawlers with a date range
@@ -30,20 +37,28 @@ class TechWatchService:
         date_range = DateRange.from_days_back(days_back)
         logger.info(f"Starting technology watch for period: {date_range}")
 
-        for crawler in self.crawlers:
-            try:
-                posts = crawler.fetch_posts_in_range(date_range)
-                self.renderer.render_posts(crawler.source_name, posts, date_range)
-                # Affichage d'une alerte visuelle si aucun post n'est trouvé
-                if hasattr(self.renderer, 'render_alert') and len(posts) == 0:
-                    self.renderer.render_alert(crawler.source_name)
-                # Fallback verification if no posts found
-                fallback_result = self.fallback_service.check_for_missed_posts(crawler, date_range, posts)
-                if fallback_result.get('has_alert', False):
-                    self.renderer.render_fallback_alert(fallback_result['message'])
-            except Exception as e:
-                logger.error(f"Error crawling {crawler.source_name}: {e}")
-                print(f"❌ Error crawling {crawler.source_name}: {e}")
+        # Crawlers are I/O bound: fetch and verify them concurrently, then render in order
+        with ThreadPoolExecutor(max_workers=min(MAX_CRAWL_WORKERS, len(self.crawlers) or 1)) as executor:
+            futures = [executor.submit(self._crawl_and_verify, crawler, date_range) for crawler in self.crawlers]
+
+            for crawler, future in zip(self.crawlers, futures):
+                try:
+                    posts, fallback_result = future.result()
+                    self.renderer.render_posts(crawler.source_name, posts, date_range)
+                    # Affichage d'une alerte visuelle si aucun post n'est trouvé
+                    if hasattr(self.renderer, 'render_alert') and len(posts) == 0:
+                        self.renderer.render_alert(crawler.source_name)
+                    if fallback_result.get('has_alert', False):
+                        self.renderer.render_fallback_alert(fallback_result['alert_message'])
+                except Exception as e:
+                    logger.error(f"Error crawling {crawler.source_name}: {e}")
+                    print(f"❌ Error crawling {crawler.source_name}: {e}")
+
+    def _crawl_and_verify(self, crawler, date_range: DateRange) -> Tuple[List[Post], Dict[str, Any]]:
+        """Fetch a crawler's posts and run the fallback verification on them (runs in a worker thread)"""
+        posts = crawler.fetch_posts_in_range(date_range)
+        fallback_result = self.fallback_service.check_for_missed_posts(crawler, date_range, posts)
+        return posts, fallback_result
 
     def fetch_posts_in_range(self, date_range: DateRange, sources: Optional[List[str]] = None) -> List[Post]:
         """Fetch all posts within a given date range
@@ -55,20 +70,28 @@ class TechWatchService:
         Returns:
             List of posts found in the range
         """
-        all_posts = []
+        crawlers = [crawler for crawler in self.crawlers if not sources or crawler.source_name in sources]
+        posts_by_source = []
+        self.last_fetch_stats = {'sources_success': 0, 'sources_failed': 0}
+        if not crawlers:
+            return []
 
-        for crawler in self.crawlers:
-            # Filter by sources if specified
-            if sources and crawler.source_name not in sources:
-                continue
+        # Fetch all sources concurrently; results are collected in crawler order
+        with ThreadPoolExecutor(max_workers=min(MAX_CRAWL_WORKERS, len(crawlers))) as executor:
+            futures = [executor.submit(crawler.fetch_posts_in_range, date_range) for crawler in crawlers]
 
-            try:
-                posts = crawler.fetch_posts_in_range(date_range)
-                all_posts.extend(posts)
-                logger.info(f"{crawler.source_name}: {len(posts)} posts found")
+            for crawler, future in zip(crawlers, futures):
+                try:
+                    posts = future.result()
+                    posts_by_source.append(posts)
+                    self.last_fetch_stats['sources_success'] += 1
+                    logger.info(f"{crawler.source_name}: {len(posts)} posts found")
 
-            except Exception as e:
-                logger.error(f"Error crawling {crawler.source_name}: {e}")
+                except Exception as e:
+                    self.last_fetch_stats['sources_failed'] += 1
+                    logger.error(f"Error crawling {crawler.source_name}: {e}")
 
+        # Flatten once, allocating the result list a single time
+        all_posts = list(chain.from_iterable(posts_by_source))
         logger.info(f"Total posts found: {len(all_posts)}")
         return all_posts
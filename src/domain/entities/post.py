@@ -4,16 +4,20 @@ Hexagonal Architecture DDD
 """
 from datetime import date
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from operator import attrgetter
 
+_FIELDS = attrgetter('title', 'url', 'date', 'source', 'description')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Post:
     """
     Post entity representing a technology watch article.
 
     This entity is part of the business domain and contains the
     fundamental business logic related to watch articles.
+    Instances are immutable and use __slots__ to keep memory low on large archives.
     """
     title: str
     url: str
@@ -23,11 +27,15 @@ class Post:
 
     def to_dict(self) -> dict:
         """Convert the post to dictionary for JSON serialization"""
-        data = asdict(self)
-        # Convert date to string for JSON serialization
-        if data['date']:
-            data['date'] = data['date'].isoformat()
-        return data
+        title, url, post_date, source, description = _FIELDS(self)
+        return {
+            'title': title,
+            'url': url,
+            # Convert date to string for JSON serialization
+            'date': post_date.isoformat() if post_date else None,
+            'source': source,
+            'description': description
+        }
 
     def is_recent(self, reference_date: date, days_threshold: int = 7) -> bool:
         """Check if the article is recent compared to a reference date"""
@@ -43,6 +51,8 @@ class Post:
 
     def __hash__(self) -> int:
         """Hash based on title and URL to avoid duplicates"""
+        # Not cached on the instance: str hashes are salted per process, so a
+        # cached value would go stale once the post is pickled to another one
         return hash((self.title, self.url))
 
     def __eq__(self, other) -> bool:
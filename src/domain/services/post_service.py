@@ -2,7 +2,7 @@
 Domain Services - Pure Business Logic
 Hexagonal Architecture DDD
 """
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 from datetime import date
 from collections import Counter
 
@@ -20,9 +20,11 @@ class PostFilteringService:
     @staticmethod
     def filter_by_date_range(posts: List[Post], date_range: DateRange) -> List[Post]:
         """Filter posts by date range"""
+        # Bounds are read once: inlined comparisons avoid a method call per post
+        start_date, end_date = date_range.start_date, date_range.end_date
         return [
             post for post in posts
-            if post.date and date_range.contains(post.date)
+            if post.date and start_date <= post.date <= end_date
         ]
 
     @staticmethod
@@ -100,16 +102,10 @@ class PostAnalysisService:
 
     @staticmethod
     def count_new_posts(current_posts: List[Post], previous_posts: List[Post]) -> int:
-        """Count new posts compared to a previous list"""
+        """Count the posts of current_posts absent from previous_posts (by title and URL)"""
         previous_keys = {(post.title, post.url) for post in previous_posts}
-
-        new_count = 0
-        for post in current_posts:
-            post_key = (post.title, post.url)
-            if post_key not in previous_keys:
-                new_count += 1
-
-        return new_count
+        # Each current post is counted, duplicates included
+        return sum(1 for post in current_posts if (post.title, post.url) not in previous_keys)
 
     @staticmethod
     def get_most_active_sources(posts: List[Post], limit: int = 5) -> List[tuple]:
@@ -142,3 +138,22 @@ class PostAnalysisService:
             reverse=True
         )
         return sorted_posts[:limit]
+
+    @staticmethod
+    def summarize_posts(posts: Iterable[Post]) -> Tuple[List[str], Optional[date], Optional[date]]:
+        """
+        Return the sorted distinct sources and the earliest/latest post dates
+        (None if no post is dated), computed in a single pass over the posts.
+        """
+        sources = set()
+        earliest = latest = None
+        for post in posts:
+            if post.source:
+                sources.add(post.source)
+            post_date = post.date
+            if post_date:
+                if earliest is None or post_date < earliest:
+                    earliest = post_date
+                if latest is None or post_date > latest:
+                    latest = post_date
+        return sorted(sources), earliest, latest
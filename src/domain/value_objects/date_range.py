@@ -46,6 +46,8 @@ class DateRange:
 
     def contains(self, check_date: date) -> bool:
         """Check if a date is within this range"""
+        # date comparisons are implemented in C: converting to ordinals first
+        # (check_date.toordinal()) measured slower, not faster
         return self.start_date <= check_date <= self.end_date
 
     def duration_days(self) -> int:
@@ -3,7 +3,7 @@ Base class for crawlers - Infrastructure
 Hexagonal Architecture DDD
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Type
 import logging
 import requests
 from bs4 import BeautifulSoup
@@ -23,8 +23,10 @@ class BaseCrawler(ABC):
     - Implement the `fetch_posts_in_range(date_range: DateRange) -> List[Post]` method
     - Use injected dependencies (http_client, html_parser, date_provider) for HTTP and parsing
     - Return a list of Post entities
+    - Decorate the class with @register_crawler so the CrawlerFactory picks it up
 
     Example:
+        @register_crawler
         class MySourceCrawler(BaseCrawler):
             @property
             def source_name(self) -> str:
@@ -109,6 +111,17 @@ class BaseCrawler(ABC):
         soup = self.html_parser.parse(response_text)
         return soup.find_all(tag, class_=class_name)
 
-    def filter_posts_by_date(self, posts: list, date_range: 'DateRange') -> list:
-        """Filter a list of Post objects by date range."""
-        return [post for post in posts if post and post.date and date_range.contains(post.date)]
+    def filter_posts_by_date(self, posts: Iterable[Post], date_range: 'DateRange') -> Iterator[Post]:
+        """Lazily filter Post objects by date range (wrap in list() if a list is needed)."""
+        return (post for post in posts if post and post.date and date_range.contains(post.date))
+
+
+# Concrete crawlers, populated at import time by @register_crawler
+CRAWLER_REGISTRY: List[Type[BaseCrawler]] = []
+
+
+def register_crawler(crawler_class: Type[BaseCrawler]) -> Type[BaseCrawler]:
+    """Class decorator registering a concrete crawler for the CrawlerFactory"""
+    if crawler_class not in CRAWLER_REGISTRY:
+        CRAWLER_REGISTRY.append(crawler_class)
+    return crawler_class
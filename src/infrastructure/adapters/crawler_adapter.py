@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 from pathlib import Path
 
 from ...domain.repositories.post_repository import CrawlerRepository
+from . import json_codec
 
 
 class FileCrawlerRepository(CrawlerRepository):
@@ -50,10 +51,7 @@ class FileCrawlerRepository(CrawlerRepository):
 
         if config_file.exists():
             try:
-                import json
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                default_config.update(file_config)
+                default_config.update(json_codec.loads(config_file.read_bytes()))
             except Exception as e:
                 self.logger.warning(f"Error reading config {crawler_name}: {e}")
 
@@ -69,9 +67,7 @@ class FileCrawlerRepository(CrawlerRepository):
         config_file = self.config_directory / f"{crawler_name}.json"
 
         try:
-            import json
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            config_file.write_bytes(json_codec.dumps(config, indent=True))
             self.logger.info(f"Configuration saved for {crawler_name}")
         except Exception as e:
             self.logger.error(f"Error saving config {crawler_name}: {e}")
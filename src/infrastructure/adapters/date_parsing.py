@@ -0,0 +1,57 @@
+"""
+Feed date parsing - Infrastructure Layer
+Hexagonal Architecture DDD
+
+Shared date parser for RSS (RFC 2822) and Atom (RFC 3339) feeds.
+A single precompiled regex recognizes every supported format in one pass,
+instead of trying several strptime formats one after the other.
+"""
+import re
+from datetime import date
+from typing import Optional
+
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+DATE_RE = re.compile(
+    # RFC 2822: "Thu, 05 Sep 2025 10:14:03 +0000" (weekday, time and timezone are optional)
+    r'(?P<rfc2822>(?:[A-Za-z]{3},\s*)?(?P<rfc_day>\d{1,2})\s+(?P<rfc_month>[A-Za-z]{3})\s+(?P<rfc_year>\d{4}))'
+    # RFC 3339 / ISO 8601: "2025-09-05T10:14:03Z", "2025-09-05 10:14:03", "2025-09-05"
+    r'|(?P<iso>(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2}))'
+)
+
+
+def parse_feed_date(date_text: str) -> Optional[date]:
+    """
+    Parse a feed publication date.
+
+    Only the calendar date is kept: the time and timezone parts are ignored,
+    as the previous strptime-based parsers did.
+
+    Args:
+        date_text: Raw date string from the feed
+
+    Returns:
+        The parsed date, or None if the format is not recognized
+    """
+    match = DATE_RE.match(date_text.strip())
+    if match is None:
+        return None
+
+    if match.group('rfc2822'):
+        month = MONTHS.get(match.group('rfc_month').title())
+        if month is None:
+            return None
+        year, day = int(match.group('rfc_year')), int(match.group('rfc_day'))
+    else:
+        year = int(match.group('iso_year'))
+        month = int(match.group('iso_month'))
+        day = int(match.group('iso_day'))
+
+    try:
+        return date(year, month, day)
+    except ValueError:
+        # Out-of-range values such as "2025-02-30"
+        return None
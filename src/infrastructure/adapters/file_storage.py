@@ -0,0 +1,94 @@
+"""
+Atomic file writes - Infrastructure Layer
+Hexagonal Architecture DDD
+
+Files are written to a temporary file in the same directory, flushed to disk,
+then renamed over the target: a crash never leaves a truncated file behind.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Iterator, Set
+
+# Directories already created by ensure_directory() in this process
+_ENSURED_DIRECTORIES: Set[Path] = set()
+
+
+def _read_umask() -> int:
+    """
+    Read the process umask without changing it: os.umask() can only read it by
+    setting it, which would briefly affect files created by other threads.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Portable fallback: create a file asking for every permission and see what the umask removed
+    with tempfile.TemporaryDirectory() as directory:
+        probe = os.path.join(directory, 'umask')
+        os.close(os.open(probe, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o777))
+        return 0o777 & ~os.stat(probe).st_mode
+
+
+@lru_cache(maxsize=None)
+def _process_umask() -> int:
+    """Process umask, read once on the first atomic write"""
+    return _read_umask()
+
+
+def _target_mode(path: Path) -> int:
+    """Permissions of the file being replaced, or those of a new file under the umask"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_process_umask()
+
+
+@contextmanager
+def atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file for binary writing that replaces path when the block exits.
+    If the block raises, the target is left untouched and the temporary file removed.
+    The target keeps its permissions (tempfile creates owner-only files).
+    """
+    path = Path(path)
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp', delete=False)
+    try:
+        with tmp as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp.name, _target_mode(path))
+        os.replace(tmp.name, path)
+    except BaseException:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+        raise
+
+
+def atomic_write(path: Path, payload: bytes) -> None:
+    """Replace the content of path with payload atomically"""
+    with atomic_open(path) as f:
+        f.write(payload)
+
+
+def fsync_path(path: Path) -> None:
+    """Flush the content of an existing file to disk"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def ensure_directory(path: Path) -> None:
+    """Create a directory (and its parents) once per process"""
+    path = Path(path)
+    if path not in _ENSURED_DIRECTORIES:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRECTORIES.add(path)
@@ -0,0 +1,52 @@
+"""
+JSON codec - Infrastructure Layer
+Hexagonal Architecture DDD
+
+Fast JSON encoding/decoding based on orjson, with a fallback on the
+standard library json module when orjson is not installed.
+"""
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date
+from typing import Any
+
+# Optional import of orjson for faster JSON I/O
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize dates (ISO format) and dataclasses like orjson does for the json fallback"""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Like orjson, private fields (leading underscore) are not serialized
+        return {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith('_')}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: bytes) -> Any:
+    """Decode a JSON document from bytes (or str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """
+    Encode an object to UTF-8 JSON bytes, pretty-printed with 2 spaces if indent is True
+    and terminated by a newline if newline is True (one JSON Lines record).
+    Dates and dataclasses (e.g. Post entities) are serialized natively.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    encoded = json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=_default)
+    return (encoded + '\n' if newline else encoded).encode('utf-8')
@@ -3,10 +3,13 @@ Technical Adapters - Infrastructure Layer
 Hexagonal Architecture DDD
 """
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import threading
+import time
 from datetime import datetime, date
 from bs4 import BeautifulSoup
-from typing import List
+from typing import Callable, List
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +17,23 @@ logger = logging.getLogger(__name__)
 class RequestsHttpClient:
     """HTTP Client based on requests - Infrastructure Layer"""
 
-    def __init__(self, timeout: int = 10, headers: dict = None):
+    def __init__(self, timeout: int = 10, headers: dict = None, session: requests.Session = None):
         self.timeout = timeout
         self.headers = headers or {}
+        # A single session keeps connections alive between requests to the same host
+        self.session = session or requests.Session()
 
-    def get(self, url: str) -> requests.Response:
+    def mount_pool(self, pool_connections: int = 32, pool_maxsize: int = 32) -> 'RequestsHttpClient':
+        """Mount a connection pool sized for several crawlers sharing this client"""
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        return self
+
+    def get(self, url: str, headers: dict = None) -> requests.Response:
+        request_headers = {**self.headers, **headers} if headers else self.headers
         try:
-            response = requests.get(url, timeout=self.timeout, headers=self.headers)
+            response = self.session.get(url, timeout=self.timeout, headers=request_headers)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
@@ -28,6 +41,41 @@ class RequestsHttpClient:
             raise
 
 
+class RateLimiter:
+    """
+    Thread-safe rate limiter - Infrastructure Layer
+
+    Spaces calls so that at most max_rate of them start per time_period seconds.
+    Unused slots are not saved up: after an idle period, calls are spaced again
+    from the first one. Use it as a context manager around the rate-limited call.
+    The clock and sleep functions can be injected for tests.
+    """
+
+    def __init__(self, max_rate: int = 1, time_period: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.interval = time_period / max_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next call slot is available"""
+        with self._lock:
+            now = self._clock()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            self._sleep(wait)
+
+    def __enter__(self) -> 'RateLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
 class BeautifulSoupParser:
     """HTML Parser based on BeautifulSoup - Infrastructure Layer"""
 
@@ -0,0 +1,8 @@
+"""
+Source-specific crawlers - Infrastructure Layer
+Hexagonal DDD Architecture
+
+Importing this package registers every crawler in CRAWLER_REGISTRY.
+Add the module of any new crawler below.
+"""
+from . import korben_crawler, reddit_php_rss_crawler  # noqa: F401
@@ -1,14 +1,16 @@
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import date
+from typing import Iterator, List, Optional
 import logging
 import xml.etree.ElementTree as ET
 
-from src.infrastructure.adapters.base_crawler import BaseCrawler
+from src.infrastructure.adapters.base_crawler import BaseCrawler, register_crawler
+from src.infrastructure.adapters.date_parsing import parse_feed_date
 from src.domain.entities.post import Post
 from src.domain.value_objects.date_range import DateRange
 
 logger = logging.getLogger(__name__)
 
+@register_crawler
 class KorbenCrawler(BaseCrawler):
     """Crawler for Korben Blog via RSS feed (no external library)"""
 
@@ -26,69 +28,71 @@ class KorbenCrawler(BaseCrawler):
             items = root.findall(".//item")
             logger.info(f"Searching in period: {date_range}")
             logger.info(f"Number of RSS articles found: {len(items)}")
-            range_posts = []
-            for i, item in enumerate(items):
-                post = self._parse_rss_item(item)
-                if not post:
-                    logger.debug(f"Korben: Article {i+1} ignored (parsing error or missing date)")
-                    continue
-                if not post.date:
-                    logger.debug(f"Korben: Article '{post.title}' ignored (date not parsed)")
-                    continue
-                if not date_range.contains(post.date):
-                    logger.debug(f"Korben: Article '{post.title}' ({post.date}) ignored (out of range)")
-                    continue
-                range_posts.append(post)
-                logger.info(f"Article found in range: {post.title} ({post.date})")
-            return range_posts
+            return list(self._iter_posts_in_range(items, date_range))
         except Exception as e:
             logger.error(f"Error during Korben RSS crawling: {e}")
             return []
 
-    def _parse_rss_item(self, item) -> Optional[Post]:
-        """Parse an RSS item from Korben"""
-        try:
-            title_element = item.find("title")
-            if title_element is None or not title_element.text:
-                return None
-            title = title_element.text.strip()
-            link_element = item.find("link")
-            if link_element is None or not link_element.text:
-                return None
-            url = link_element.text.strip()
-            pub_date_element = item.find("pubDate")
-            if pub_date_element is None or not pub_date_element.text:
-                return None
-            post_date = self._parse_rss_date(pub_date_element.text.strip())
+    def _iter_posts_in_range(self, items, date_range: DateRange) -> Iterator[Post]:
+        """
+        Parse and filter RSS items in a single pass.
+
+        The date is parsed first so that out-of-range items are skipped before
+        any Post is built, and a malformed item is skipped on its own. Every item
+        is checked: the feed is mostly newest first, but republished or updated
+        articles can appear out of order.
+        """
+        for i, item in enumerate(items):
+            try:
+                post_date = self._extract_date(item)
+                if not post_date:
+                    logger.debug(f"Korben: Article {i+1} ignored (parsing error or missing date)")
+                    continue
+                if not date_range.contains(post_date):
+                    logger.debug(f"Korben: Article {i+1} ({post_date}) ignored (out of range)")
+                    continue
+                post = self._parse_rss_item(item, post_date)
+            except (AttributeError, ValueError, KeyError) as e:
+                # A malformed item is skipped without dropping the rest of the feed
+                logger.debug(f"Korben: Article {i+1} ignored (malformed item: {e})")
+                continue
+            if not post:
+                logger.debug(f"Korben: Article {i+1} ignored (parsing error)")
+                continue
+            logger.info(f"Article found in range: {post.title} ({post.date})")
+            yield post
+
+    def _extract_date(self, item) -> Optional[date]:
+        """Extract the publication date of an RSS item"""
+        pub_date_element = item.find("pubDate")
+        if pub_date_element is None or not pub_date_element.text:
+            return None
+        return self._parse_rss_date(pub_date_element.text.strip())
+
+    def _parse_rss_item(self, item, post_date: Optional[date] = None) -> Optional[Post]:
+        """Parse an RSS item from Korben (post_date skips date parsing when already known)"""
+        if post_date is None:
+            post_date = self._extract_date(item)
             if not post_date:
                 return None
-            return Post(
-                title=title,
-                url=url,
-                date=post_date,
-                source=self.source_name
-            )
-        except Exception as e:
-            logger.warning(f"Error parsing Korben RSS item: {e}")
+        title_element = item.find("title")
+        if title_element is None or not title_element.text:
+            return None
+        title = title_element.text.strip()
+        link_element = item.find("link")
+        if link_element is None or not link_element.text:
             return None
+        url = link_element.text.strip()
+        return Post(
+            title=title,
+            url=url,
+            date=post_date,
+            source=self.source_name
+        )
 
     def _parse_rss_date(self, date_text: str) -> Optional[date]:
         """Parse RSS date in RFC 2822 format"""
-        try:
-            formats = [
-                "%a, %d %b %Y %H:%M:%S %z",    # "Thu, 05 Sep 2025 10:14:03 +0000"
-                "%a, %d %b %Y %H:%M:%S",       # "Thu, 05 Sep 2025 10:14:03"
-                "%d %b %Y %H:%M:%S %z",        # "05 Sep 2025 10:14:03 +0000"
-                "%d %b %Y %H:%M:%S",           # "05 Sep 2025 10:14:03"
-                "%Y-%m-%d",                    # "2025-09-05" (fallback)
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_text, fmt).date()
-                except ValueError:
-                    continue
+        post_date = parse_feed_date(date_text)
+        if post_date is None:
             logger.debug(f"Unrecognized Korben RSS date format: {date_text}")
-            return None
-        except Exception as e:
-            logger.debug(f"Error parsing Korben RSS date: {e}")
-            return None
+        return post_date
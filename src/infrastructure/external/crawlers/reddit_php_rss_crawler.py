@@ -1,20 +1,29 @@
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import date
+from typing import Iterator, List, Optional
 import logging
 import re
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse
 
-from src.infrastructure.adapters.base_crawler import BaseCrawler
+from src.infrastructure.adapters.base_crawler import BaseCrawler, register_crawler
+from src.infrastructure.adapters.date_parsing import parse_feed_date
+from src.infrastructure.adapters.technical_adapters import RateLimiter
 from src.domain.entities.post import Post
 from src.domain.value_objects.date_range import DateRange
 
 logger = logging.getLogger(__name__)
 
+# Atom namespace
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+@register_crawler
 class RedditPhpRssCrawler(BaseCrawler):
     """Crawler for r/PHP via RSS feed - anti-bot-proof solution"""
 
     RSS_URL = "https://www.reddit.com/r/PHP/.rss"
+    USER_AGENT = 'Mozilla/5.0 (Linux; Technology Watch Tool)'
+    # Shared by all instances: stay under Reddit's rate cap (1 request every 2 seconds)
+    _limiter = RateLimiter(max_rate=1, time_period=2.0)
 
     @property
     def source_name(self) -> str:
@@ -23,13 +32,7 @@ class RedditPhpRssCrawler(BaseCrawler):
     def fetch_posts_in_range(self, date_range: DateRange) -> List[Post]:
         """Fetches r/PHP posts within a date range via RSS/Atom"""
         try:
-            user_agent = 'Mozilla/5.0 (Linux; Technology Watch Tool)'
-            # Instancie le client HTTP avec le User-Agent si besoin
-            if not hasattr(self.http_client, 'headers') or self.http_client.headers.get('User-Agent') != user_agent:
-                from src.infrastructure.adapters.technical_adapters import RequestsHttpClient
-                self.http_client = RequestsHttpClient(headers={'User-Agent': user_agent})
-            # Appel sans paramètre headers
-            response = self.http_client.get(self.RSS_URL)
+            response = self._fetch_feed()
 
             # Parse XML RSS/Atom
             root = ET.fromstring(response.text)
@@ -37,53 +40,55 @@ class RedditPhpRssCrawler(BaseCrawler):
             # Détection robuste du format (RSS ou Atom)
             items = root.findall(".//item")
             if not items:
-                items = root.findall(".//{http://www.w3.org/2005/Atom}entry")
+                items = root.findall(f".//{ATOM_NS}entry")
             logger.info(f"Searching in period: {date_range}")
             logger.info(f"Number of RSS/Atom articles found: {len(items)}")
 
             if not items:
                 logger.warning("Aucun post trouvé dans le flux RSS/Atom de Reddit. Vérifiez le format ou l'accès réseau.")
 
-            range_posts = []
+            return list(self._iter_posts_in_range(items, date_range))
+        except Exception as e:
+            logger.error(f"Erreur lors du crawling RSS Reddit: {e}")
+            return []
 
-            for i, item in enumerate(items):
-                post = self._parse_feed_item(item)
-                if not post:
+    def _iter_posts_in_range(self, items, date_range: DateRange) -> Iterator[Post]:
+        """
+        Parse and filter RSS/Atom items in a single pass.
+
+        The date is parsed first so that out-of-range items are skipped before
+        any Post is built, and a malformed item is skipped on its own. The feed
+        is sorted by popularity, not by date, so every item is checked.
+        """
+        for i, item in enumerate(items):
+            try:
+                post_date = self._extract_date(item)
+                if not post_date:
                     logger.debug(f"Reddit: Article {i+1} ignoré (erreur de parsing ou date manquante)")
                     continue
-                if not post.date:
-                    logger.debug(f"Reddit: Article '{post.title}' ignoré (date non parsée)")
-                    continue
-                if not date_range.contains(post.date):
-                    logger.debug(f"Reddit: Article '{post.title}' ({post.date}) ignoré (hors période)")
+                if not date_range.contains(post_date):
+                    logger.debug(f"Reddit: Article {i+1} ({post_date}) ignoré (hors période)")
                     continue
-                range_posts.append(post)
-                logger.info(f"Article trouvé dans la période: {post.title} ({post.date})")
-
-            return range_posts
-        except Exception as e:
-            logger.error(f"Erreur lors du crawling RSS Reddit: {e}")
-            return []
+                post = self._parse_feed_item(item, post_date)
+            except (AttributeError, ValueError, KeyError) as e:
+                # A malformed item is skipped without dropping the rest of the feed
+                logger.debug(f"Reddit: Article {i+1} ignoré (élément invalide : {e})")
+                continue
+            if not post:
+                logger.debug(f"Reddit: Article {i+1} ignoré (erreur de parsing)")
+                continue
+            logger.info(f"Article trouvé dans la période: {post.title} ({post.date})")
+            yield post
 
     def fetch_recent_posts_for_fallback(self) -> List[Post]:
         """Fetches all recent r/PHP RSS/Atom posts without date filter (for fallback verification)"""
         try:
-            user_agent = 'Mozilla/5.0 (Linux; Technology Watch Tool)'
-            if not hasattr(self.http_client, 'headers') or self.http_client.headers.get('User-Agent') != user_agent:
-                from src.infrastructure.adapters.technical_adapters import RequestsHttpClient
-                self.http_client = RequestsHttpClient(headers={'User-Agent': user_agent})
-
-            response = self.http_client.get(self.RSS_URL)
+            response = self._fetch_feed()
             # Parse XML RSS/Atom
-            user_agent = 'Mozilla/5.0 (Linux; Technology Watch Tool)'
-            if not hasattr(self.http_client, 'headers') or self.http_client.headers.get('User-Agent') != user_agent:
-                from src.infrastructure.adapters.technical_adapters import RequestsHttpClient
-                self.http_client = RequestsHttpClient(headers={'User-Agent': user_agent})
-
-            response = self.http_client.get(self.RSS_URL)
+            root = ET.fromstring(response.text)
             items = root.findall(".//item")
             if not items:
-                items = root.findall(".//{http://www.w3.org/2005/Atom}entry")
+                items = root.findall(f".//{ATOM_NS}entry")
             logger.debug(f"r/PHP RSS/Atom fallback verification: {len(items)} articles trouvés")
 
             fallback_posts = []
@@ -97,148 +102,102 @@ class RedditPhpRssCrawler(BaseCrawler):
             logger.error(f"Erreur lors de la vérification fallback RSS/Atom Reddit: {e}")
             return []
 
-    def _parse_feed_item(self, item) -> Optional[Post]:
-        """Parse an RSS or Atom item from r/PHP"""
-        try:
-            # Detect format (RSS or Atom) and parse accordingly
-            if item.tag.endswith('}entry'):  # Atom format
-                return self._parse_atom_entry(item)
-            else:  # RSS format
-                return self._parse_rss_item(item)
-        except Exception as e:
-            logger.warning(f"Error parsing r/PHP feed item: {e}")
-            return None
-
-    def _parse_atom_entry(self, entry) -> Optional[Post]:
-        """Parse an Atom entry from r/PHP"""
-        try:
-            # Atom namespace
-            atom_ns = "{http://www.w3.org/2005/Atom}"
+    def _fetch_feed(self):
+        """Fetch the r/PHP feed, rate-limited to avoid HTTP 429 responses"""
+        with self._limiter:
+            # Reddit requires a User-Agent: send it per request so the shared client stays untouched
+            return self.http_client.get(self.RSS_URL, headers={'User-Agent': self.USER_AGENT})
 
-            # Extract title
-            title_element = entry.find(f"{atom_ns}title")
-            if title_element is None or not title_element.text:
+    def _parse_feed_item(self, item, post_date: Optional[date] = None) -> Optional[Post]:
+        """Parse an RSS or Atom item from r/PHP (post_date skips date parsing when already known)"""
+        if post_date is None:
+            post_date = self._extract_date(item)
+            if not post_date:
+                return None
+        # Detect format (RSS or Atom) and parse accordingly
+        if item.tag.endswith('}entry'):  # Atom format
+            return self._parse_atom_entry(item, post_date)
+        else:  # RSS format
+            return self._parse_rss_item(item, post_date)
+
+    def _extract_date(self, item) -> Optional[date]:
+        """Extract the publication date of an RSS item or Atom entry"""
+        if item.tag.endswith('}entry'):  # Atom format
+            date_element = item.find(f"{ATOM_NS}updated")
+            if date_element is None:
+                date_element = item.find(f"{ATOM_NS}published")
+            if date_element is None or not date_element.text:
                 return None
+            return self._parse_atom_date(date_element.text.strip())
 
-            title = title_element.text.strip()
+        # RSS format
+        pub_date_element = item.find("pubDate")
+        if pub_date_element is None or not pub_date_element.text:
+            return None
+        return self._parse_rss_date(pub_date_element.text.strip())
 
-            # Extract URL (look for link with rel="alternate")
-            link_element = entry.find(f"{atom_ns}link[@rel='alternate']")
-            if link_element is None:
-                # Fallback: first link found
-                link_element = entry.find(f"{atom_ns}link")
+    def _parse_atom_entry(self, entry, post_date: date) -> Optional[Post]:
+        """Parse an Atom entry from r/PHP"""
+        # Extract title
+        title_element = entry.find(f"{ATOM_NS}title")
+        if title_element is None or not title_element.text:
+            return None
 
-            if link_element is None:
-                return None
+        title = title_element.text.strip()
 
-            url = link_element.get('href', '').strip()
-            if not url:
-                return None
+        # Extract URL (look for link with rel="alternate")
+        link_element = entry.find(f"{ATOM_NS}link[@rel='alternate']")
+        if link_element is None:
+            # Fallback: first link found
+            link_element = entry.find(f"{ATOM_NS}link")
 
-            # Extract publication date
-            updated_element = entry.find(f"{atom_ns}updated")
-            if updated_element is None:
-                published_element = entry.find(f"{atom_ns}published")
-                if published_element is None:
-                    return None
-                date_text = published_element.text.strip()
-            else:
-                date_text = updated_element.text.strip()
-
-            post_date = self._parse_atom_date(date_text)
-            if not post_date:
-                return None
+        if link_element is None:
+            return None
 
-            return Post(
-                title=title,
-                url=url,
-                date=post_date,
-                source=self.source_name
-            )
-        except Exception as e:
-            logger.warning(f"Error parsing r/PHP Atom entry: {e}")
+        url = link_element.get('href', '').strip()
+        if not url:
             return None
 
-    def _parse_rss_item(self, item) -> Optional[Post]:
-        """Parse an RSS item from r/PHP"""
-        try:
-            # Extract title
-            title_element = item.find("title")
-            if title_element is None or not title_element.text:
-                return None
+        return Post(
+            title=title,
+            url=url,
+            date=post_date,
+            source=self.source_name
+        )
 
-            title = title_element.text.strip()
+    def _parse_rss_item(self, item, post_date: date) -> Optional[Post]:
+        """Parse an RSS item from r/PHP"""
+        # Extract title
+        title_element = item.find("title")
+        if title_element is None or not title_element.text:
+            return None
 
-            # Extract URL
-            link_element = item.find("link")
-            if link_element is None or not link_element.text:
-                return None
+        title = title_element.text.strip()
 
-            url = link_element.text.strip()
+        # Extract URL
+        link_element = item.find("link")
+        if link_element is None or not link_element.text:
+            return None
 
-            # Extract publication date
-            pub_date_element = item.find("pubDate")
-            if pub_date_element is None or not pub_date_element.text:
-                return None
+        url = link_element.text.strip()
 
-            post_date = self._parse_rss_date(pub_date_element.text.strip())
-            if not post_date:
-                return None
-
-            return Post(
-                title=title,
-                url=url,
-                date=post_date,
-                source=self.source_name
-            )
-        except Exception as e:
-            logger.warning(f"Error parsing r/PHP RSS item: {e}")
-            return None
+        return Post(
+            title=title,
+            url=url,
+            date=post_date,
+            source=self.source_name
+        )
 
     def _parse_atom_date(self, date_text: str) -> Optional[date]:
         """Parse Atom date in RFC 3339 format"""
-        try:
-            # Standard Atom format: "2025-09-05T10:14:03Z"
-            # Also support dates with timezone offset: "2025-09-05T10:14:03+02:00"
-            formats = [
-                "%Y-%m-%dT%H:%M:%S%z",  # "2025-09-05T10:14:03+0000" or "2025-09-05T10:14:03+02:00"
-                "%Y-%m-%dT%H:%M:%SZ",   # "2025-09-05T10:14:03Z" (UTC)
-                "%Y-%m-%d %H:%M:%S",    # "2025-09-05 10:14:03" (without timezone)
-                "%Y-%m-%d",              # "2025-09-05" (fallback)
-            ]
-
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_text, fmt).date()
-                except ValueError:
-                    continue
-
+        post_date = parse_feed_date(date_text)
+        if post_date is None:
             logger.debug(f"Unrecognized Atom date format: {date_text}")
-            return None
-        except Exception as e:
-            logger.debug(f"Error parsing Atom date: {e}")
-            return None
+        return post_date
 
     def _parse_rss_date(self, date_text: str) -> Optional[date]:
         """Parse RSS date in RFC 2822 format"""
-        try:
-            # Standard RSS format: "Thu, 05 Sep 2025 10:14:03 +0000"
-            formats = [
-                "%a, %d %b %Y %H:%M:%S %z",    # "Thu, 05 Sep 2025 10:14:03 +0000"
-                "%a, %d %b %Y %H:%M:%S",       # "Thu, 05 Sep 2025 10:14:03" (without timezone)
-                "%d %b %Y %H:%M:%S %z",        # "05 Sep 2025 10:14:03 +0000"
-                "%d %b %Y %H:%M:%S",           # "05 Sep 2025 10:14:03"
-                "%Y-%m-%d",                    # "2025-09-05" (fallback)
-            ]
-
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_text, fmt).date()
-                except ValueError:
-                    continue
-
+        post_date = parse_feed_date(date_text)
+        if post_date is None:
             logger.debug(f"Unrecognized RSS date format: {date_text}")
-            return None
-        except Exception as e:
-            logger.debug(f"Error parsing RSS date: {e}")
-            return None
+        return post_date
@@ -3,35 +3,21 @@ Factory to create crawlers with their dependencies
 Hexagonal Architecture DDD - Infrastructure Layer
 """
 
-import importlib.util
-import inspect
-import os
-import sys
-from pathlib import Path
+from ..adapters.base_crawler import CRAWLER_REGISTRY
+from ..adapters.technical_adapters import RequestsHttpClient
+from ..external import crawlers  # noqa: F401 - registers all crawlers
+
+# Process-wide HTTP client: every crawler reuses the same connection pool
+_shared_http = RequestsHttpClient().mount_pool(pool_maxsize=32)
+
 
 class CrawlerFactory:
-    """Factory to dynamically create all RSS crawlers in the crawlers directory"""
+    """Factory to create all RSS crawlers registered with @register_crawler"""
 
     @staticmethod
     def get_all_crawlers():
-        """Dynamically discover and instantiate all available RSS crawlers"""
-        crawlers = []
-        crawlers_dir = Path(__file__).parent.parent / "external" / "crawlers"
-        for file in crawlers_dir.glob("*_crawler.py"):
-            module_name = file.stem
-            spec = importlib.util.spec_from_file_location(module_name, str(file))
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            try:
-                spec.loader.exec_module(module)
-                # Find the concrete crawler class (ignore BaseCrawler)
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if name.lower().endswith("crawler") and name.lower() != "basecrawler" and obj.__module__ == module.__name__:
-                        crawlers.append(obj())
-                        break
-            except Exception as e:
-                print(f"Error loading crawler from {file.name}: {e}")
-        return crawlers
+        """Instantiate all registered RSS crawlers"""
+        return [crawler_class(http_client=_shared_http) for crawler_class in CRAWLER_REGISTRY]
 
     @staticmethod
     def get_available_sources():
@@ -2,113 +2,417 @@
 JSON Persistence Adapter - Infrastructure
 Hexagonal Architecture DDD
 
-This repository now manages a single database file (techwatch_db.json) for all technology watch articles.
-All new articles are appended to this file, and duplicates are avoided by URL.
+This repository manages a single database for all technology watch articles, stored as
+JSON Lines sharded by month (techwatch_db_2025_09.jsonl, one article per line, plus
+techwatch_db_undated.jsonl for posts without a date). A manifest
+(techwatch_db.manifest.json) maps each month to its shard, and metadata lives in a
+sidecar file (techwatch_db.metadata.json).
+New articles are appended to the shard of their month, and duplicates are avoided by URL
+thanks to a persistent URL index (techwatch_db.urls.idx), so a save never re-reads
+nor rewrites the existing archive, and a load can open only the months it needs.
+A second index (techwatch_db.idx) stores 64-bit digests of each article's title and URL,
+to tell known articles apart without parsing the archive.
+Legacy techwatch_db.json and unsharded techwatch_db.jsonl databases are migrated
+automatically on first access.
 This design ensures robust, maintainable, and scalable persistence, and is ready for future migration to a real database if needed.
 """
-import json
+import mmap
 import os
-from datetime import datetime, date
-from typing import List, Dict, Any, Tuple
+import re
+import struct
+from hashlib import blake2b
+from contextlib import ExitStack
+from operator import attrgetter
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Optional, Set
 from pathlib import Path
 import logging
 
 from ...domain.entities.post import Post
+from ...domain.services.post_service import PostAnalysisService
 from ...domain.repositories.post_repository import PostRepository
+from ..adapters import json_codec
+from ..adapters.file_storage import atomic_open, atomic_write, ensure_directory, fsync_path
+
+_DATE_PREFIX_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# Fetches the serialized fields of a Post in a single C-level call
+_POST_FIELDS = attrgetter('title', 'url', 'date', 'source')
+
+# Shard key of posts without a date
+UNDATED_SHARD = "undated"
+
+# Digests in the title/URL index are stored as little-endian unsigned 64-bit integers
+_DIGEST = struct.Struct('<Q')
 
 logger = logging.getLogger(__name__)
 
+
+def title_url_digest(title: str, url: str) -> int:
+    """Return the stable 64-bit digest identifying an article by its title and URL"""
+    digest = blake2b(title.encode('utf-8') + b'\0' + url.encode('utf-8'), digest_size=8).digest()
+    return _DIGEST.unpack(digest)[0]
+
+
+# Optional import of ijson for streaming reads of the legacy database
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 class JsonPostRepository(PostRepository):
     """
-    Concrete repository implementation for a single JSON file persistence.
+    Concrete repository implementation for a single JSON Lines database, sharded by month.
 
-    This class manages a unique database file (techwatch_db.json).
-    All articles are stored in this file, and all read/write operations are centralized.
+    Articles are appended to techwatch_db_YYYY_MM.jsonl shards listed in
+    techwatch_db.manifest.json, metadata lives in techwatch_db.metadata.json,
+    and all read/write operations are centralized here.
     """
 
-    def __init__(self, db_path: str = "var/saves/techwatch_db.json"):
+    def __init__(self, db_path: str = "var/saves/techwatch_db.json", fsync_every: int = 1):
         """
         Initialize the repository with the path to the database file.
+        The shards, manifest and metadata files are derived from this path
+        (techwatch_db_YYYY_MM.jsonl, techwatch_db.manifest.json and techwatch_db.metadata.json).
+        Appended data is flushed to disk every fsync_every saves (see flush()).
         Creates the parent directory if it does not exist.
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(self.db_path.parent)
+        # Unsharded JSON Lines database of previous versions, migrated on first access
+        self.articles_path = self.db_path.with_suffix('.jsonl')
+        self.manifest_path = self.db_path.with_name(f"{self.db_path.stem}.manifest.json")
+        self.metadata_path = self.db_path.with_name(f"{self.db_path.stem}.metadata.json")
+        self.urls_index_path = self.db_path.with_name(f"{self.db_path.stem}.urls.idx")
+        self.digests_index_path = self.db_path.with_name(f"{self.db_path.stem}.idx")
+        # URLs already stored, loaded once from the URL index on the first save
+        self._known_urls: Optional[Set[str]] = None
+        self._migration_checked = False
+        self.fsync_every = fsync_every
+        self._unsynced_saves = 0
+        self._unsynced_paths: Set[Path] = set()
+        # Last load_latest() result, keyed by the requested range and the files' (mtime_ns, size)
+        self._load_cache: Optional[Tuple[tuple, List[Post], Dict[str, Any]]] = None
 
     def save(self, posts: List[Post], metadata: Dict[str, Any] = None) -> bool:
         """
-        Append new posts to the database, avoiding duplicates by URL.
+        Append new posts to the shards of their month, avoiding duplicates by URL.
         Metadata is updated with each save (last metadata wins).
         Returns True on success, False otherwise.
         """
         try:
-            # Load existing database
-            if self.db_path.exists():
-                with open(self.db_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                existing_articles = data.get('articles', [])
-            else:
-                existing_articles = []
+            self._migrate_legacy_database()
+            if self._known_urls is None:
+                self._known_urls = self._load_known_urls()
+
+            new_lines: Dict[str, List[bytes]] = {}
+            new_urls = []
+            new_digests = []
+            for post in posts:
+                if post.url in self._known_urls:
+                    continue
+                self._known_urls.add(post.url)
+                new_urls.append(post.url)
+                new_digests.append(title_url_digest(post.title, post.url))
+                new_lines.setdefault(self._shard_key(post.date), []).append(
+                    json_codec.dumps(self._post_to_dict(post), newline=True)
+                )
 
-            # Build set of existing URLs to avoid duplicates
-            existing_urls = set(a.get('url') for a in existing_articles)
-            new_articles = [self._post_to_dict(post) for post in posts if post.url not in existing_urls]
+            # Append the new articles of each month in a single write, then index their URLs
+            if new_lines:
+                manifest = self._read_manifest()
+                for key, lines in new_lines.items():
+                    path = self.shard_path(key)
+                    with open(path, 'ab') as f:
+                        f.write(b''.join(lines))
+                    self._unsynced_paths.add(path)
+                if not manifest.keys() >= new_lines.keys():
+                    manifest.update((key, self.shard_path(key).name) for key in new_lines)
+                    self._write_manifest(manifest)
+                self._append_to_urls_index(new_urls)
+                if self.digests_index_path.exists():
+                    self._append_to_index(self.digests_index_path, b''.join(map(_DIGEST.pack, new_digests)))
+                else:
+                    # Build the whole index, new articles included
+                    self._rebuild_digests_index()
+                self._unsynced_saves += 1
+                if self._unsynced_saves >= self.fsync_every:
+                    self.flush()
 
-            # Merge articles
-            all_articles = existing_articles + new_articles
+            self._load_cache = None
 
             # Generate or update metadata
             if metadata is None:
                 metadata = self._generate_metadata(posts)
             # Note: only the latest metadata is kept
+            self._write_metadata(metadata)
 
-            # Save to database
-            db_data = {
-                "metadata": metadata,
-                "articles": all_articles
-            }
-            with open(self.db_path, 'w', encoding='utf-8') as f:
-                json.dump(db_data, f, ensure_ascii=False, indent=2)
-
-            logger.info(f"Database updated: {len(new_articles)} new posts, total {len(all_articles)} posts.")
+            logger.info(f"Database updated: {len(new_urls)} new posts, total {len(self._known_urls)} posts.")
             return True
         except Exception as e:
             logger.error(f"Error saving posts to database: {e}")
             return False
 
-    def load_latest(self) -> Tuple[List[Post], Dict[str, Any]]:
+    def load_latest(self, days_back: Optional[int] = None) -> Tuple[List[Post], Dict[str, Any]]:
         """
-        Load all posts and metadata from the database file.
+        Load posts and metadata from the database.
+        With days_back, only the shards of the months covering the last days_back days
+        are read, and only posts dated within that period are returned.
+        The decoded result is cached until the files change on disk.
         Returns a tuple (posts, metadata).
         """
         try:
-            if not self.db_path.exists():
+            self._migrate_legacy_database()
+            manifest = self._read_manifest()
+            if not manifest:
                 logger.warning("Database file not found")
                 return [], {}
-            with open(self.db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            metadata = data.get('metadata', {})
-            articles_data = data.get('articles', [])
-            posts = []
-            for article_data in articles_data:
-                try:
-                    post = self._dict_to_post(article_data)
-                    posts.append(post)
-                except Exception as e:
-                    logger.warning(f"Error converting article to post: {e}")
-                    continue
+
+            since = date.today() - timedelta(days=days_back) if days_back is not None else None
+            paths = [self.shard_path(key) for key in self._select_shards(manifest, since)]
+            cache_key = (since, self._files_signature(paths))
+            if self._load_cache is not None and self._load_cache[0] == cache_key:
+                _, posts, metadata = self._load_cache
+                return list(posts), dict(metadata)
+
+            metadata = self._read_metadata()
+            posts = self._dicts_to_posts(self._iter_articles(paths))
+            if since is not None:
+                posts = [post for post in posts if post.date and post.date >= since]
             logger.info(f"Loaded {len(posts)} posts from database")
-            return posts, metadata
+            self._load_cache = (cache_key, posts, metadata)
+            return list(posts), dict(metadata)
         except Exception as e:
             logger.error(f"Error loading posts from database: {e}")
             return [], {}
 
+    def iter_title_url(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the (title, url) pair of every stored article.
+        Reads the raw articles without building Post entities nor parsing dates.
+        """
+        self._migrate_legacy_database()
+        for article in self._iter_articles():
+            yield article.get('title', ''), article.get('url', '')
+
+    def find_known_digests(self, digests: Set[int]) -> Set[int]:
+        """
+        Return the given digests (see title_url_digest()) that belong to stored articles.
+        The memory-mapped index is rebuilt from the shards only when it is missing.
+        The index is scanned once against the given set, so memory stays
+        bounded by the number of digests checked instead of the size of the archive.
+        """
+        if not digests:
+            return set()
+        self._migrate_legacy_database()
+        if not self._read_manifest():
+            # Drop a stale index left without its database
+            self.digests_index_path.unlink(missing_ok=True)
+            return set()
+        if not self.digests_index_path.exists():
+            return self._rebuild_digests_index() & digests
+
+        with open(self.digests_index_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return {digest for (digest,) in _DIGEST.iter_unpack(mm) if digest in digests}
+
+    def _rebuild_digests_index(self) -> Set[int]:
+        """Write the digest index from the stored articles and return its digests"""
+        digests = {title_url_digest(title, url) for title, url in self.iter_title_url()}
+        atomic_write(self.digests_index_path, b''.join(map(_DIGEST.pack, digests)))
+        return digests
+
+    def shard_path(self, key: str) -> Path:
+        """Return the file of a shard, from its key (YYYY-MM or 'undated')"""
+        return self.db_path.with_name(f"{self.db_path.stem}_{key.replace('-', '_')}.jsonl")
+
+    @staticmethod
+    def _shard_key(post_date: Optional[date]) -> str:
+        """Return the shard key of a post date: its month as YYYY-MM"""
+        if not post_date:
+            return UNDATED_SHARD
+        return f"{post_date.year:04d}-{post_date.month:02d}"
+
+    def _select_shards(self, manifest: Dict[str, str], since: Optional[date] = None) -> List[str]:
+        """
+        Return the shard keys to read, oldest month first and undated posts last.
+        With since, only the months from since onwards are kept.
+        """
+        months = sorted(key for key in manifest if key != UNDATED_SHARD)
+        if since is not None:
+            first_month = self._shard_key(since)
+            return [key for key in months if key >= first_month]
+        if UNDATED_SHARD in manifest:
+            months.append(UNDATED_SHARD)
+        return months
+
+    def _files_signature(self, paths: List[Path]) -> tuple:
+        """Return (mtime_ns, size) of the manifest, metadata and given shard files"""
+        signature = []
+        for path in (self.manifest_path, self.metadata_path, *paths):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def flush(self) -> None:
+        """
+        Flush appended articles and URL index to disk.
+        Called automatically every fsync_every saves; call it explicitly at the end
+        of a multi-save session when fsync_every is greater than 1.
+        """
+        if not self._unsynced_saves:
+            return
+        for path in (*self._unsynced_paths, self.urls_index_path, self.digests_index_path):
+            if path.exists():
+                fsync_path(path)
+        self._unsynced_paths.clear()
+        self._unsynced_saves = 0
+
+    def _iter_articles(self, paths: Optional[Iterable[Path]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield raw article dictionaries from the given shards (all shards by default)"""
+        if paths is None:
+            paths = [self.shard_path(key) for key in self._select_shards(self._read_manifest())]
+        for path in paths:
+            if path.exists():
+                yield from self._iter_file_articles(path)
+
+    def _iter_file_articles(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw article dictionaries of a JSON Lines file one line at a time.
+        The file is memory-mapped, so lines are read straight from the page cache
+        and peak memory is bounded by a single article instead of the whole file.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # An empty file cannot be mapped
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    if line.strip():
+                        yield json_codec.loads(line)
+
+    def _load_known_urls(self) -> Set[str]:
+        """
+        Load the set of URLs already stored in the database from the URL index.
+        The index is rebuilt from the shards if it is missing.
+        """
+        if not self._read_manifest():
+            # Drop a stale index left without its database
+            self.urls_index_path.unlink(missing_ok=True)
+            return set()
+        if self.urls_index_path.exists():
+            return set(self.urls_index_path.read_text(encoding='utf-8').splitlines())
+
+        urls = {article.get('url') for article in self._iter_articles() if article.get('url')}
+        self._append_to_urls_index(urls)
+        return urls
+
+    def _append_to_urls_index(self, urls) -> None:
+        """Append URLs to the index file in a single write"""
+        self._append_to_index(self.urls_index_path, b''.join(url.encode('utf-8') + b'\n' for url in urls))
+
+    @staticmethod
+    def _append_to_index(path: Path, payload: bytes) -> None:
+        """Append payload to an index file in a single write"""
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    def _read_manifest(self) -> Dict[str, str]:
+        """Read the shard manifest, mapping shard keys to file names (empty if missing)"""
+        if not self.manifest_path.exists():
+            return {}
+        return json_codec.loads(self.manifest_path.read_bytes())
+
+    def _write_manifest(self, manifest: Dict[str, str]) -> None:
+        """Replace the shard manifest atomically"""
+        atomic_write(self.manifest_path, json_codec.dumps(dict(sorted(manifest.items()))))
+
+    def _read_metadata(self) -> Dict[str, Any]:
+        """Read the sidecar metadata file (empty if missing)"""
+        if not self.metadata_path.exists():
+            return {}
+        return json_codec.loads(self.metadata_path.read_bytes())
+
+    def _write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Replace the sidecar metadata file atomically"""
+        atomic_write(self.metadata_path, json_codec.dumps(metadata))
+
+    def _migrate_legacy_database(self) -> None:
+        """
+        Convert a legacy techwatch_db.json document, or an unsharded techwatch_db.jsonl
+        file, to monthly shards. The legacy file is kept with a .bak suffix.
+        """
+        if self._migration_checked:
+            return
+        self._migration_checked = True
+        if self.manifest_path.exists():
+            return
+
+        if self.articles_path.exists():
+            legacy_path = self.articles_path
+            metadata, articles = None, self._iter_file_articles(self.articles_path)
+        elif self.db_path.exists():
+            legacy_path = self.db_path
+            metadata, articles = self._read_legacy_database()
+        else:
+            return
+
+        logger.info(f"Migrating legacy database {legacy_path} to monthly shards")
+        self._write_shards(articles)
+        if metadata is not None:
+            self._write_metadata(metadata)
+        os.replace(legacy_path, legacy_path.with_name(legacy_path.name + '.bak'))
+
+    def _write_shards(self, articles: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write raw articles to new shard files, then the manifest listing them.
+        Shards are written atomically: if anything fails, none of them is created.
+        """
+        manifest: Dict[str, str] = {}
+        with ExitStack() as stack:
+            shard_files = {}
+            for article in articles:
+                key = self._shard_key(self._parse_date(article.get('date')))
+                if key not in shard_files:
+                    shard_files[key] = stack.enter_context(atomic_open(self.shard_path(key)))
+                    manifest[key] = self.shard_path(key).name
+                shard_files[key].write(json_codec.dumps(article, newline=True))
+        self._write_manifest(manifest)
+
+    def _read_legacy_database(self) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Read a legacy single-document database.
+        With ijson, articles are streamed one at a time instead of building the whole document.
+        """
+        if IJSON_AVAILABLE:
+            with open(self.db_path, 'rb') as f:
+                # Metadata is written first, so parsing stops before the articles
+                metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+            return metadata, self._iter_legacy_articles()
+        data = json_codec.loads(self.db_path.read_bytes())
+        return data.get('metadata', {}), iter(data.get('articles', []))
+
+    def _iter_legacy_articles(self) -> Iterator[Dict[str, Any]]:
+        """Stream raw articles from a legacy database (requires ijson)"""
+        with open(self.db_path, 'rb') as f:
+            yield from ijson.items(f, 'articles.item', use_float=True)
+
     def _generate_metadata(self, posts: List[Post]) -> Dict[str, Any]:
         """
         Generate metadata for a list of posts.
         Includes sources, date range, and format version.
         """
-        sources = list(set(post.source for post in posts))
-        dates = [post.date for post in posts if post.date]
+        sources, earliest, latest = PostAnalysisService.summarize_posts(posts)
 
         metadata = {
             "generated_at": datetime.now().isoformat(),
@@ -117,11 +421,11 @@ class JsonPostRepository(PostRepository):
             "format_version": "2.0"
         }
 
-        if dates:
+        if earliest:
             metadata["date_range"] = {
-                "earliest": min(dates).isoformat(),
-                "latest": max(dates).isoformat(),
-                "days_range": (max(dates) - min(dates)).days + 1
+                "earliest": earliest.isoformat(),
+                "latest": latest.isoformat(),
+                "days_range": (latest - earliest).days + 1
             }
 
         return metadata
@@ -129,36 +433,63 @@ class JsonPostRepository(PostRepository):
     def _post_to_dict(self, post: Post) -> Dict[str, Any]:
         """
         Convert a Post entity to a dictionary for JSON serialization.
+        Dates are kept as date objects: the JSON codec writes them in ISO format.
         """
-        return {
-            "title": post.title,
-            "url": post.url,
-            "date": post.date.isoformat() if post.date else None,
-            "source": post.source
-        }
+        title, url, post_date, source = _POST_FIELDS(post)
+        return {"title": title, "url": url, "date": post_date, "source": source}
 
     def _dict_to_post(self, data: Dict[str, Any]) -> Post:
         """
         Convert a dictionary to a Post entity.
         Handles ISO and common date formats.
         """
-        post_date = None
-        if data.get('date'):
-            try:
-                post_date = datetime.fromisoformat(data['date']).date()
-            except (ValueError, TypeError):
-                try:
-                    post_date = datetime.strptime(data['date'], '%Y-%m-%d').date()
-                except (ValueError, TypeError):
-                    post_date = None
-
         return Post(
             title=data.get('title', ''),
             url=data.get('url', ''),
-            date=post_date,
+            date=self._parse_date(data.get('date')),
             source=data.get('source', '')
         )
 
+    def _dicts_to_posts(self, articles: Iterator[Dict[str, Any]]) -> List[Post]:
+        """
+        Convert raw articles to Post entities in bulk.
+        Articles share few distinct dates, so each date string is parsed only once.
+        """
+        posts = []
+        append = posts.append
+        parse_date = self._parse_date
+        parsed_dates: Dict[Any, Optional[date]] = {}
+        for data in articles:
+            try:
+                raw_date = data.get('date')
+                post_date = parsed_dates.get(raw_date)
+                if post_date is None and raw_date not in parsed_dates:
+                    post_date = parsed_dates[raw_date] = parse_date(raw_date)
+                append(Post(
+                    title=data.get('title', ''),
+                    url=data.get('url', ''),
+                    date=post_date,
+                    source=data.get('source', '')
+                ))
+            except Exception as e:
+                logger.warning(f"Error converting article to post: {e}")
+        return posts
+
+    @staticmethod
+    def _parse_date(raw_date: Any) -> Optional[date]:
+        """Parse a stored ISO date (or datetime) string, None if missing or invalid"""
+        if not raw_date:
+            return None
+        try:
+            return date.fromisoformat(raw_date)
+        except (ValueError, TypeError):
+            # Fallback for datetime strings: keep the leading YYYY-MM-DD
+            match = _DATE_PREFIX_RE.match(raw_date) if isinstance(raw_date, str) else None
+            try:
+                return date(int(match[1]), int(match[2]), int(match[3])) if match else None
+            except ValueError:
+                return None
+
     # Deprecated methods for legacy tests (raise NotImplementedError)
     def delete_save(self, *args, **kwargs):
         """Deprecated: multi-file save deletion is not supported anymore."""
@@ -38,22 +38,29 @@ class FallbackVerificationService:
         }
 
         try:
+            # Count posts and find the most recent date in a single sweep
+            found_count = 0
+            most_recent = None
+            for post in found_posts:
+                found_count += 1
+                if post.date and (most_recent is None or post.date > most_recent):
+                    most_recent = post.date
+
             # Verification 1: No posts found in recent period
-            if not found_posts and date_range.contains(date.today()):
+            if not found_count and date_range.contains(date.today()):
                 result['has_alert'] = True
                 result['alert_message'] = f"⚠️ {crawler.source_name}: No posts found today. Possible parsing issue."
                 result['confidence_score'] = 0.3
                 return result
 
             # Verification 2: Very few posts over extended period
-            if len(found_posts) <= 1 and date_range.duration_days() >= 7:
+            if found_count <= 1 and date_range.duration_days() >= 7:
                 result['has_alert'] = True
-                result['alert_message'] = f"⚠️ {crawler.source_name}: Only {len(found_posts)} post(s) found over {date_range.duration_days()} days. Check site structure."
+                result['alert_message'] = f"⚠️ {crawler.source_name}: Only {found_count} post(s) found over {date_range.duration_days()} days. Check site structure."
                 result['confidence_score'] = 0.5
 
             # Verification 3: No recent posts but period includes recent days
-            if found_posts:
-                most_recent = max(post.date for post in found_posts if post.date)
+            if most_recent is not None:
                 days_since_last = (date.today() - most_recent).days
 
                 if days_since_last > 3 and date_range.contains(date.today()):
@@ -64,15 +71,15 @@ class FallbackVerificationService:
             # Verification 4: Try fallback method to verify
             try:
                 fallback_posts = crawler.fetch_recent_posts_for_fallback()
-                if fallback_posts and not found_posts:
+                if fallback_posts and not found_count:
                     result['has_alert'] = True
                     result['alert_message'] = f"⚠️ {crawler.source_name}: Found {len(fallback_posts)} posts via fallback but none in date range. Check date parsing."
                     result['fallback_posts'] = fallback_posts[:3]  # Keep only first 3 for display
                     result['confidence_score'] = 0.2
 
-                elif len(fallback_posts) > len(found_posts) * 3:
+                elif len(fallback_posts) > found_count * 3:
                     result['has_alert'] = True
-                    result['alert_message'] = f"⚠️ {crawler.source_name}: Significant difference between fallback ({len(fallback_posts)}) and filtered posts ({len(found_posts)}). Check filtering logic."
+                    result['alert_message'] = f"⚠️ {crawler.source_name}: Significant difference between fallback ({len(fallback_posts)}) and filtered posts ({found_count}). Check filtering logic."
                     result['confidence_score'] = 0.4
 
             except Exception as fallback_error:
@@ -119,28 +126,28 @@ class FallbackVerificationService:
             analysis['recommendations'].append("Check if the source is accessible and has recent content")
             return analysis
 
-        # Check for posts without dates
-        posts_without_date = [p for p in posts if p.date is None]
-        if posts_without_date:
-            ratio = len(posts_without_date) / len(posts)
-            analysis['quality_score'] -= ratio * 0.5
-            analysis['issues'].append(f"{len(posts_without_date)}/{len(posts)} posts without date")
+        # Count posts without dates, with invalid URLs and with very short titles in a single pass
+        without_date = invalid_url = short_titles = 0
+        for post in posts:
+            without_date += post.date is None
+            invalid_url += not (post.url and post.url.startswith('http'))
+            short_titles += len(post.title or '') < 10
+        total = len(posts)
+
+        if without_date:
+            analysis['quality_score'] -= without_date / total * 0.5
+            analysis['issues'].append(f"{without_date}/{total} posts without date")
             analysis['recommendations'].append("Review date extraction logic")
 
-        # Check for posts without proper URLs
-        posts_without_url = [p for p in posts if not p.url or not p.url.startswith('http')]
-        if posts_without_url:
-            ratio = len(posts_without_url) / len(posts)
-            analysis['quality_score'] -= ratio * 0.3
-            analysis['issues'].append(f"{len(posts_without_url)}/{len(posts)} posts with invalid URLs")
+        if invalid_url:
+            analysis['quality_score'] -= invalid_url / total * 0.3
+            analysis['issues'].append(f"{invalid_url}/{total} posts with invalid URLs")
             analysis['recommendations'].append("Review URL extraction and resolution logic")
 
-        # Check for very short titles (potential parsing issues)
-        short_titles = [p for p in posts if len(p.title or '') < 10]
+        # Very short titles point to potential parsing issues
         if short_titles:
-            ratio = len(short_titles) / len(posts)
-            analysis['quality_score'] -= ratio * 0.2
-            analysis['issues'].append(f"{len(short_titles)}/{len(posts)} posts with very short titles")
+            analysis['quality_score'] -= short_titles / total * 0.2
+            analysis['issues'].append(f"{short_titles}/{total} posts with very short titles")
             analysis['recommendations'].append("Review title extraction logic")
 
         # Ensure score doesn't go below 0
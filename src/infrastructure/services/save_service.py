@@ -2,12 +2,14 @@
 Save service - Infrastructure
 Hexagonal Architecture DDD
 """
-import json
 from datetime import datetime
 from typing import List, Dict, Any
 from pathlib import Path
 
 from ...domain.entities.post import Post
+from ...domain.services.post_service import PostAnalysisService
+from ..adapters import json_codec
+from ..adapters.file_storage import atomic_write, ensure_directory
 
 
 class SaveService:
@@ -20,7 +22,7 @@ class SaveService:
 
     def __init__(self, saves_directory: str = "var/saves"):
         self.saves_directory = Path(saves_directory)
-        self.saves_directory.mkdir(parents=True, exist_ok=True)
+        ensure_directory(self.saves_directory)
 
     def save_all_formats(self, posts: List[Post], metadata: Dict[str, Any] = None) -> str:
         """
@@ -45,24 +47,23 @@ class SaveService:
 
         return save_id
 
-    def save_json(self, posts: List[Post], metadata: Dict[str, Any], save_id: str) -> Path:
-        """Save in structured JSON format"""
+    def save_json(self, posts: List[Post], metadata: Dict[str, Any], save_id: str, pretty: bool = False) -> Path:
+        """Save in structured JSON format, compact unless pretty is True (human-readable export)"""
         filepath = self.saves_directory / f"{save_id}.json"
 
         data = {
             "metadata": metadata,
-            "articles": [post.to_dict() for post in posts]
+            # Posts are dataclasses: the JSON codec serializes them directly, dates in ISO format
+            "articles": posts
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        atomic_write(filepath, json_codec.dumps(data, indent=pretty))
 
         return filepath
 
     def _generate_metadata(self, posts: List[Post]) -> Dict[str, Any]:
         """Generate metadata for a list of posts"""
-        sources = list(set(post.source for post in posts if post.source))
-        dates = [post.date for post in posts if post.date]
+        sources, earliest, latest = PostAnalysisService.summarize_posts(posts)
 
         return {
             "generated_at": datetime.now().isoformat(),
@@ -70,7 +71,7 @@ class SaveService:
             "sources": sources,
             "format_version": "2.0",
             "date_range": {
-                "earliest": min(dates).isoformat() if dates else None,
-                "latest": max(dates).isoformat() if dates else None
+                "earliest": earliest.isoformat() if earliest else None,
+                "latest": latest.isoformat() if latest else None
             }
         }
@@ -2,8 +2,10 @@
 Console Renderer - Presentation Layer
 Hexagonal Architecture DDD
 """
+import sys
 from typing import List
 from datetime import date
+from itertools import groupby
 
 from ...domain.entities.post import Post
 from ...domain.value_objects.date_range import DateRange
@@ -13,30 +15,33 @@ class ConsoleRenderer:
     """Console display of results - Presentation Layer"""
 
     def render_posts(self, source_name: str, posts: List[Post], date_range: DateRange) -> None:
-        """Display posts from a source in the console"""
-        print(f"\n📍 {source_name} ({date_range})")
+        """Display posts from a source in the console, written to stdout in a single call"""
+        lines = [f"\n📍 {source_name} ({date_range})"]
         if posts:
-            # Group posts by date
-            posts_by_date = {}
-            for post in posts:
-                post_date = post.date or date.today()
-                if post_date not in posts_by_date:
-                    posts_by_date[post_date] = []
-                posts_by_date[post_date].append(post)
-
-            # Display by date (most recent to oldest)
-            for post_date in sorted(posts_by_date.keys(), reverse=True):
+            # Sort once (most recent to oldest) and group consecutive posts by date
+            today = date.today()
+
+            def date_key(post: Post) -> date:
+                return post.date or today
+
+            posts_by_date = [
+                (post_date, list(group))
+                for post_date, group in groupby(sorted(posts, key=date_key, reverse=True), key=date_key)
+            ]
+
+            for post_date, date_posts in posts_by_date:
                 if len(posts_by_date) > 1:  # Display date only if there are multiple dates
-                    print(f"  📅 {post_date}")
+                    lines.append(f"  📅 {post_date}")
 
-                for post in posts_by_date[post_date]:
-                    print(f"  ✅ {post.title}")
-                    print(f"  🔗 {post.url}")
+                for post in date_posts:
+                    lines.append(f"  ✅ {post.title}")
+                    lines.append(f"  🔗 {post.url}")
                     if len(posts_by_date) == 1 and post.date:  # Display date if single date
-                        print(f"  📅 {post.date}")
-                print()  # Empty line between dates
+                        lines.append(f"  📅 {post.date}")
+                lines.append("")  # Empty line between dates
         else:
-            print("❌ No articles found in this period.")
+            lines.append("❌ No articles found in this period.")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def render_fallback_alert(self, alert_message: str) -> None:
         """Display a fallback verification alert"""
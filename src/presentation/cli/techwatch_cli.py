@@ -9,6 +9,7 @@ All documentation and help messages are in English for consistency and accessibi
 import argparse
 import logging
 import sys
+from itertools import groupby
 from typing import Optional, List
 
 from ...application.use_cases.techwatch_use_cases import (
@@ -21,6 +22,11 @@ from ...infrastructure.repositories.json_post_repository import JsonPostReposito
 from ...infrastructure.adapters.crawler_adapter import FileCrawlerRepository
 
 
+def _source_key(post) -> str:
+    """Grouping key of the show command: the post source, or a placeholder"""
+    return post.source or "Unknown source"
+
+
 class TechWatchCLI:
     """
     Command line interface for the technology watch tool.
@@ -98,25 +104,21 @@ class TechWatchCLI:
             if not result.posts:
                 print("📭 No articles found with the specified criteria.")
                 return
-            posts = [dto.to_entity() for dto in result.posts]
-            if args.limit:
-                posts = posts[:args.limit]
-            posts_by_source = {}
-            for post in posts:
-                source = post.source or "Unknown source"
-                if source not in posts_by_source:
-                    posts_by_source[source] = []
-                posts_by_source[source].append(post)
-            print(f"📊 {len(posts)} articles found")
-            print(f"🎯 {len(posts_by_source)} sources\n")
-            for source, source_posts in posts_by_source.items():
-                print(f"📍 {source} ({len(source_posts)} articles)")
+            # Apply the limit before grouping; DTOs already carry the displayed
+            # fields (date as an ISO string), so no conversion to entities is needed
+            posts = result.posts[:args.limit] if args.limit else result.posts
+            posts_by_source = [(source, list(group)) for source, group in groupby(sorted(posts, key=_source_key), key=_source_key)]
+            lines = [f"📊 {len(posts)} articles found", f"🎯 {len(posts_by_source)} sources\n"]
+            for source, source_posts in posts_by_source:
+                lines.append(f"📍 {source} ({len(source_posts)} articles)")
                 for post in source_posts:
-                    print(f"  ✅ {post.title}")
-                    print(f"  🔗 {post.url}")
+                    lines.append(f"  ✅ {post.title}")
+                    lines.append(f"  🔗 {post.url}")
                     if post.date:
-                        print(f"  📅 {post.date}")
-                    print()
+                        lines.append(f"  📅 {post.date}")
+                    lines.append("")
+            # Write the whole listing at once rather than one print per line
+            sys.stdout.write("\n".join(lines) + "\n")
         except Exception as e:
             self.logger.error(f"Error showing results: {e}")
             print(f"❌ Error: {e}")
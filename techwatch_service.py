@@ -9,29 +9,39 @@ import logging
 import os
 import sys
 from datetime import datetime, date, timedelta
+from functools import cached_property
 from typing import List, Optional
 import argparse
 
 # Imports from the new hexagonal architecture
-from src.application.use_cases.techwatch_use_cases import SaveDataUseCase, AnalyzeDataUseCase
-from src.application.dto.post_dto import PostDTO
-from src.infrastructure.repositories.json_post_repository import JsonPostRepository
-from src.infrastructure.adapters.crawler_adapter import FileCrawlerRepository
+from src.infrastructure.repositories.json_post_repository import JsonPostRepository, title_url_digest
 
 # Legacy imports for transition (to be migrated progressively)
 from src.infrastructure.factories.crawler_factory import CrawlerFactory
 from src.application.services.techwatch_service import TechWatchService
 from src.presentation.cli.console_renderer import ConsoleRenderer
-from src.infrastructure.services.save_service import SaveService
 from src.domain.entities.post import Post
 from src.domain.value_objects.date_range import DateRange
 
-# Optional import of plyer for notifications
-try:
-    from plyer import notification
-    NOTIFICATIONS_AVAILABLE = True
-except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
+
+def _setup_logging_once():
+    """Configure file logging for the console service, once per process"""
+    if getattr(_setup_logging_once, "_done", False):
+        return
+    os.makedirs('var/logs', exist_ok=True)
+    log_file = 'var/logs/techwatch_service.log'
+    # Remove all handlers if already set
+    for handler in logging.root.handlers[:]:
+        logging.root.removeHandler(handler)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file)
+        ]
+    )
+    _setup_logging_once._done = True
+
 
 class TechWatchConsoleService:
     """
@@ -48,11 +58,8 @@ class TechWatchConsoleService:
         self.crawler_factory = CrawlerFactory()
         self.console_renderer = ConsoleRenderer()
 
-        # Get all available crawlers
-        all_crawlers = self.crawler_factory.get_all_crawlers()
-
         # Services
-        self.techwatch_service = TechWatchService(crawlers=all_crawlers, renderer=self.console_renderer)
+        self.techwatch_service = TechWatchService(crawlers=self.all_crawlers, renderer=self.console_renderer)
         self.json_repo = JsonPostRepository()
 
         # Session statistics
@@ -65,21 +72,19 @@ class TechWatchConsoleService:
             'end_time': None
         }
 
+    @cached_property
+    def all_crawlers(self) -> list:
+        """All available crawlers, instantiated once per service"""
+        return self.crawler_factory.get_all_crawlers()
+
+    @cached_property
+    def available_sources(self) -> List[str]:
+        """Names of the available sources, derived from the crawlers already instantiated"""
+        return [crawler.source_name for crawler in self.all_crawlers]
+
     def setup_logging(self):
         """Logging configuration for the console service (file only, no console)"""
-        os.makedirs('var/logs', exist_ok=True)
-        log_file = 'var/logs/techwatch_service.log'
-        # Remove all handlers if already set
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file)
-            ]
-        )
-
+        _setup_logging_once()
         self.logger = logging.getLogger(__name__)
         self.logger.info("=== Starting technology watch console service ===")
 
@@ -111,28 +116,33 @@ class TechWatchConsoleService:
 
             # Launch crawling
             posts = self.techwatch_service.fetch_posts_in_range(date_range, sources)
+            self.session_stats.update(self.techwatch_service.last_fetch_stats)
 
-            self.session_stats['articles_found'] = len(posts)
-            available_sources = self.crawler_factory.get_available_sources()
-            self.session_stats['sources_crawled'] = len(available_sources)
+            total_posts = len(posts)
+            self.session_stats['articles_found'] = total_posts
+            self.session_stats['sources_crawled'] = len(self.available_sources)
 
             if posts:
-                # Save results to the unified database
-                success = self.json_repo.save(posts)
-                if success:
-                    self.logger.info(f"Results saved to techwatch_db.json")
-                else:
-                    self.logger.error(f"Error saving results to techwatch_db.json")
-
-                # Check for new articles
+                # Check for new articles before saving, against the articles already stored
                 new_articles_count = self.check_for_new_articles(posts)
 
+                # When detection failed (None), save anyway: the repository dedups by URL
+                if new_articles_count == 0:
+                    self.logger.info("No new articles, skipping database write")
+                else:
+                    # Save results to the unified database (only unseen URLs are appended)
+                    success = self.json_repo.save(posts)
+                    if success:
+                        self.logger.info(f"Results saved to techwatch_db.json")
+                    else:
+                        self.logger.error(f"Error saving results to techwatch_db.json")
+
                 # Final statistics
                 self.log_session_stats()
 
                 # Notification if new articles
-                if new_articles_count > 0:
-                    self.send_notification(new_articles_count, len(posts))
+                if new_articles_count:
+                    self.send_notification(new_articles_count, total_posts)
 
                 return True
             else:
@@ -145,33 +155,36 @@ class TechWatchConsoleService:
         finally:
             self.session_stats['end_time'] = datetime.now()
 
-    def check_for_new_articles(self, current_posts: List[Post]) -> int:
+    def check_for_new_articles(self, current_posts: List[Post]) -> Optional[int]:
         """
         Check if there are new articles compared to the unified database.
-        Uses a simple hash based on title + URL for detection.
+        Articles are identified by a digest of their title and URL.
+        Returns None if the detection failed.
         """
         try:
-            # Load all existing articles from techwatch_db.json
-            existing_posts, _ = self.json_repo.load_latest()
-            existing_hashes = set(f"{post.title}|{post.url}" for post in existing_posts)
+            # Digests of the session's articles; duplicates in the session count once
+            current_digests = {title_url_digest(post.title, post.url) for post in current_posts}
 
-            # Count new articles
-            new_count = 0
-            for post in current_posts:
-                post_hash = f"{post.title}|{post.url}"
-                if post_hash not in existing_hashes:
-                    new_count += 1
+            # Only the session's digests are kept in memory while scanning the index
+            new_count = len(current_digests - self.json_repo.find_known_digests(current_digests))
 
             self.logger.info(f"New articles detected: {new_count}/{len(current_posts)}")
             return new_count
 
         except Exception as e:
             self.logger.error(f"Error detecting new articles: {e}")
-            return 0
+            return None
 
     def send_notification(self, new_articles: int, total_articles: int):
-        """Send desktop notification of results"""
-        if not NOTIFICATIONS_AVAILABLE:
+        """Send desktop notification of results (skipped in silent mode)"""
+        if self.silent_mode:
+            self.logger.info(f"Silent mode: notification skipped ({new_articles} new articles)")
+            return
+
+        # Optional import of plyer, only loaded when a notification is sent
+        try:
+            from plyer import notification
+        except ImportError:
             self.logger.info("Notifications not available (plyer not installed)")
             return
 
@@ -195,6 +208,7 @@ class TechWatchConsoleService:
             self.logger.info(f"Duration: {duration_str}")
             self.logger.info(f"Sources crawled: {self.session_stats['sources_crawled']}")
             self.logger.info(f"Articles found: {self.session_stats['articles_found']}")
+            self.logger.info(f"Sources succeeded/failed: {self.session_stats['sources_success']}/{self.session_stats['sources_failed']}")
 
 def main():
     """Entry point of the console service"""
@@ -16,16 +16,12 @@ class TestDomainApplicationIntegration(unittest.TestCase):
 
     def setUp(self):
         """Setup with temporary repository and unified database file"""
-        self.temp_dir = tempfile.mkdtemp()
+        # Removed automatically after each test, even when setUp or the test fails
+        self.temp_dir = self.enterContext(tempfile.TemporaryDirectory())
         self.db_path = os.path.join(self.temp_dir, "techwatch_db.json")
         self.repository = JsonPostRepository(db_path=self.db_path)
         self.use_case = LoadDataUseCase(self.repository)
 
-    def tearDown(self):
-        """Cleanup temporary files"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_save_and_load_integration(self):
         """Test save and load integration with unified database"""
         # Arrange - Create test posts
@@ -1,77 +1,84 @@
 """
 Main script to run all tests
+
+Tests run with pytest, in parallel across all cores when pytest-xdist
+is installed. Without pytest, only the unittest-based modules are run.
 """
 import unittest
 import sys
 import os
 
+# Root directory of the project
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
 # Add root directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, ROOT_DIR)
+
+# Optional import of pytest, and of pytest-xdist for parallel test execution
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+try:
+    import xdist  # noqa: F401
+    XDIST_AVAILABLE = PYTEST_AVAILABLE
+except ImportError:
+    XDIST_AVAILABLE = False
+
+# Test directories of each layer
+TEST_SUITES = {
+    'domain': 'tests/unit/domain',
+    'application': 'tests/unit/application',
+    'infrastructure': 'tests/unit/infrastructure',
+    'integration': 'tests/integration',
+}
+
+
+def run_tests(directories):
+    """Run the tests found in the given directories and return True on success"""
+    directories = [os.path.join(ROOT_DIR, directory) for directory in directories]
+
+    if PYTEST_AVAILABLE:
+        # One whole module per worker keeps module-scoped fixtures built once
+        parallel = ['-n', 'auto', '--dist=loadfile'] if XDIST_AVAILABLE else []
+        return pytest.main([*parallel, *directories]) == 0
+
+    # Discover every directory from the project root, then run them as a single suite
+    # (pytest-style test functions are not collected by unittest)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        loader.discover(directory, pattern='test_*.py', top_level_dir=ROOT_DIR)
+        for directory in directories
+    )
+    runner = unittest.TextTestRunner(verbosity=2)
+    return runner.run(suite).wasSuccessful()
 
 
 def run_all_tests():
     """Run all DDD architecture tests"""
-
-    # Automatic test discovery
-    loader = unittest.TestLoader()
-
-    # Domain unit tests
-    domain_suite = loader.discover('tests/unit/domain', pattern='test_*.py')
-
-    # Application unit tests
-    application_suite = loader.discover('tests/unit/application', pattern='test_*.py')
-
-    # Infrastructure unit tests
-    infrastructure_suite = loader.discover('tests/unit/infrastructure', pattern='test_*.py')
-
-    # Integration tests
-    integration_suite = loader.discover('tests/integration', pattern='test_*.py')
-
-    # Combine all test suites
-    all_tests = unittest.TestSuite([
-        domain_suite,
-        application_suite,
-        infrastructure_suite,
-        integration_suite
-    ])
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(all_tests)
-
-    return result.wasSuccessful()
+    return run_tests(TEST_SUITES.values())
 
 
 def run_domain_tests():
     """Run only Domain layer tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests/unit/domain', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite).wasSuccessful()
+    return run_tests([TEST_SUITES['domain']])
 
 
 def run_application_tests():
     """Run only Application layer tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests/unit/application', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite).wasSuccessful()
+    return run_tests([TEST_SUITES['application']])
 
 
 def run_infrastructure_tests():
     """Run only Infrastructure layer tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests/unit/infrastructure', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite).wasSuccessful()
+    return run_tests([TEST_SUITES['infrastructure']])
 
 
 def run_integration_tests():
     """Run only integration tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests/integration', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite).wasSuccessful()
+    return run_tests([TEST_SUITES['integration']])
 
 
 if __name__ == '__main__':
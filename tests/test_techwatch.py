@@ -2,6 +2,7 @@
 Unit tests for the technology watch tool - DDD Architecture Compatible
 Legacy file maintained for backward compatibility
 """
+import io
 import unittest
 from unittest.mock import Mock, patch
 from datetime import date
@@ -165,14 +166,46 @@ class TestTechWatchService(unittest.TestCase):
         self.assertEqual(result[0].title, "Post 1")
 
 
+    def test_fetch_posts_isolates_failing_sources(self):
+        """Test that a failing source does not abort the concurrent fetch"""
+        self.mock_crawlers[0].fetch_posts_in_range.side_effect = RuntimeError("boom")
+        self.mock_crawlers[0].source_name = "Source 1"
+        self.mock_crawlers[1].fetch_posts_in_range.return_value = [Post(title="Post 2", url="http://example2.com")]
+        self.mock_crawlers[1].source_name = "Source 2"
+
+        result = self.service.fetch_posts_in_range(DateRange.from_days_back(7))
+
+        self.assertEqual([post.title for post in result], ["Post 2"])
+        self.assertEqual(self.service.last_fetch_stats, {'sources_success': 1, 'sources_failed': 1})
+
+    @patch('builtins.print')
+    def test_run_renders_sources_in_order(self, mock_print):
+        """Test that concurrent crawls are rendered in crawler order and errors are isolated"""
+        self.mock_crawlers[0].fetch_posts_in_range.side_effect = RuntimeError("boom")
+        self.mock_crawlers[0].source_name = "Source 1"
+        self.mock_crawlers[1].fetch_posts_in_range.return_value = [Post(title="Post 2", url="http://example2.com")]
+        self.mock_crawlers[1].source_name = "Source 2"
+        self.service.fallback_service = Mock()
+        self.service.fallback_service.check_for_missed_posts.return_value = {
+            'has_alert': True, 'alert_message': "⚠️ Source 2: check"
+        }
+
+        self.service.run(days_back=7)
+
+        mock_print.assert_any_call("❌ Error crawling Source 1: boom")
+        self.mock_renderer.render_posts.assert_called_once()
+        self.assertEqual(self.mock_renderer.render_posts.call_args.args[0], "Source 2")
+        self.mock_renderer.render_fallback_alert.assert_called_once_with("⚠️ Source 2: check")
+
+
 class TestConsoleRenderer(unittest.TestCase):
     """Tests for ConsoleRenderer (Presentation Layer)"""
 
     def setUp(self):
         self.renderer = ConsoleRenderer()
 
-    @patch('builtins.print')
-    def test_render_posts_with_results(self, mock_print):
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_render_posts_with_results(self, mock_stdout):
         """Test rendering posts when results are found"""
         posts = [
             Post(title="Test Post", url="http://example.com", date=date(2025, 9, 8)),
@@ -181,11 +214,30 @@ class TestConsoleRenderer(unittest.TestCase):
 
         self.renderer.render_posts("Test Source", posts, date_range)
 
-        # Verify print was called
-        self.assertTrue(mock_print.called)
+        output = mock_stdout.getvalue()
+        self.assertIn("📍 Test Source", output)
+        self.assertIn("  ✅ Test Post\n  🔗 http://example.com\n  📅 2025-09-08\n", output)
 
-    @patch('builtins.print')
-    def test_render_posts_no_results(self, mock_print):
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_render_posts_groups_by_date(self, mock_stdout):
+        """Test that posts are grouped by date, most recent first"""
+        posts = [
+            Post(title="Old Post", url="http://example.com/1", date=date(2025, 9, 6)),
+            Post(title="New Post", url="http://example.com/2", date=date(2025, 9, 8)),
+            Post(title="Other Old Post", url="http://example.com/3", date=date(2025, 9, 6)),
+        ]
+        date_range = DateRange.from_days_back(7)
+
+        self.renderer.render_posts("Test Source", posts, date_range)
+
+        lines = mock_stdout.getvalue().splitlines()
+        self.assertEqual([line for line in lines if "📅" in line or "✅" in line], [
+            "  📅 2025-09-08", "  ✅ New Post",
+            "  📅 2025-09-06", "  ✅ Old Post", "  ✅ Other Old Post",
+        ])
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_render_posts_no_results(self, mock_stdout):
         """Test rendering when no posts are found"""
         posts = []
         date_range = DateRange.from_days_back(0)
@@ -193,7 +245,7 @@ class TestConsoleRenderer(unittest.TestCase):
         self.renderer.render_posts("Test Source", posts, date_range)
 
         # Verify "No articles found" message
-        mock_print.assert_any_call("❌ No articles found in this period.")
+        self.assertIn("❌ No articles found in this period.\n", mock_stdout.getvalue())
 
     @patch('builtins.print')
     def test_render_fallback_alert(self, mock_print):
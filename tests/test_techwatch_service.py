@@ -0,0 +1,87 @@
+"""
+Unit tests for the technology watch console service - DDD Hexagonal Architecture
+"""
+import pytest
+from unittest.mock import Mock, patch
+import builtins
+import os
+import sys
+from datetime import date
+import techwatch_service
+from src.domain.entities.post import Post
+from src.infrastructure.repositories.json_post_repository import JsonPostRepository
+
+SESSION_POSTS = (
+    Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Stub Source"),
+    Post("Post 2", "https://example.com/2", date(2025, 9, 7), "Stub Source"),
+)
+
+
+@pytest.fixture(autouse=True)
+def no_side_effects(monkeypatch):
+    """Skip the log file setup and disk flushes: neither is under test"""
+    monkeypatch.setattr(techwatch_service, '_setup_logging_once', lambda: None)
+    monkeypatch.setattr(os, 'fsync', lambda fd: None)
+
+
+@pytest.fixture
+def stub_crawler():
+    """Crawler returning the session posts, without network access"""
+    crawler = Mock(source_name="Stub Source")
+    crawler.fetch_posts_in_range.return_value = list(SESSION_POSTS)
+    return crawler
+
+
+@pytest.fixture
+def service(monkeypatch, stub_crawler, tmp_path):
+    """Silent console service on the stub crawler and a temporary repository"""
+    monkeypatch.setattr(techwatch_service.CrawlerFactory, 'get_all_crawlers', lambda self: [stub_crawler])
+    console_service = techwatch_service.TechWatchConsoleService(silent_mode=True)
+    console_service.json_repo = JsonPostRepository(db_path=str(tmp_path / "techwatch_db.json"))
+    return console_service
+
+
+def test_run_techwatch_saves_and_counts_new_articles(service):
+    """Test that new articles are saved and reported with a non-zero count"""
+    with patch.object(service, 'send_notification') as mock_notify:
+        assert service.run_techwatch()
+
+    mock_notify.assert_called_once_with(2, 2)
+    loaded_posts, _ = service.json_repo.load_latest()
+    assert [post.title for post in loaded_posts] == ["Post 1", "Post 2"]
+
+
+def test_run_techwatch_skips_write_when_nothing_is_new(service):
+    """Test that a session with only known articles neither writes nor notifies"""
+    service.json_repo.save(list(SESSION_POSTS))
+
+    with patch.object(service.json_repo, 'save') as mock_save, \
+            patch.object(service, 'send_notification') as mock_notify:
+        assert service.run_techwatch()
+
+    assert service.check_for_new_articles(list(SESSION_POSTS)) == 0
+    mock_save.assert_not_called()
+    mock_notify.assert_not_called()
+
+
+def test_send_notification_silent_mode_never_loads_plyer(service, monkeypatch):
+    """Test that silent mode neither imports plyer nor calls it"""
+    fake_plyer = Mock()
+    monkeypatch.setitem(sys.modules, 'plyer', fake_plyer)
+
+    with patch.object(builtins, '__import__', wraps=builtins.__import__) as mock_import:
+        service.send_notification(2, 2)
+
+    assert 'plyer' not in [call.args[0] for call in mock_import.call_args_list]
+    fake_plyer.notification.notify.assert_not_called()
+
+
+def test_send_notification_calls_plyer_outside_silent_mode(service, monkeypatch):
+    """Test that the notification is sent through plyer when not silent"""
+    fake_plyer = Mock()
+    monkeypatch.setitem(sys.modules, 'plyer', fake_plyer)
+    service.silent_mode = False
+
+    service.send_notification(2, 2)
+
+    fake_plyer.notification.notify.assert_called_once()
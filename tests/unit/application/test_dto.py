@@ -57,6 +57,18 @@ class TestPostDTO(unittest.TestCase):
         self.assertEqual(entity.date, date(2025, 9, 8))
         self.assertEqual(entity.source, "DTO Source")
 
+    def test_to_entity_date_formats(self):
+        """Test that datetime strings are accepted and invalid dates dropped"""
+        cases = [
+            ("2025-09-08T10:14:03", date(2025, 9, 8)),
+            ("not a date", None),
+            ("", None),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                dto = PostDTO(title="T", url="u", date=value, source="S")
+                self.assertEqual(dto.to_entity().date, expected)
+
 
 class TestResultDTO(unittest.TestCase):
     """Tests for Result DTO"""
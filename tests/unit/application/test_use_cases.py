@@ -1,68 +1,69 @@
 """
 Unit tests for Use Cases - DDD Hexagonal Architecture
 """
-import unittest
-from unittest.mock import Mock, MagicMock
+import pytest
+from unittest.mock import Mock
 from datetime import date
 from src.domain.entities.post import Post
+from src.domain.repositories.post_repository import PostRepository
 from src.application.use_cases.techwatch_use_cases import LoadDataUseCase
-from src.application.dto.post_dto import PostDTO, ResultDTO
-
-
-class TestLoadDataUseCase(unittest.TestCase):
-    """Tests for LoadDataUseCase use case"""
-
-    def setUp(self):
-        """Setup mocks for tests"""
-        self.mock_repository = Mock()
-        self.use_case = LoadDataUseCase(self.mock_repository)
-
-    def test_load_latest_success(self):
-        """Test loading latest data successfully"""
-        # Arrange
-        mock_posts = [
-            Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source A"),
-            Post("Post 2", "https://example.com/2", date(2025, 9, 7), "Source B")
-        ]
-        mock_metadata = {"timestamp": "2025-09-08T10:00:00", "sources": 2}
-        self.mock_repository.load_latest.return_value = (mock_posts, mock_metadata)
-
-        # Act
-        result = self.use_case.load_latest()
-
-        # Assert
-        self.assertIsInstance(result, ResultDTO)
-        self.assertEqual(len(result.posts), 2)
-        self.assertEqual(result.total_count, 2)
-        self.assertEqual(result.metadata, mock_metadata)
-        self.mock_repository.load_latest.assert_called_once()
-
-    def test_load_latest_empty_result(self):
-        """Test loading with empty result"""
-        # Arrange
-        self.mock_repository.load_latest.return_value = ([], {})
-
-        # Act
-        result = self.use_case.load_latest()
-
-        # Assert
-        self.assertEqual(len(result.posts), 0)
-        self.assertEqual(result.total_count, 0)
-        self.assertEqual(result.metadata, {})
-
-    def test_load_filtered_with_source_filter(self):
-        """Test loading with source filter"""
-        # Arrange
-        mock_posts = [
-            Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Blog"),
-            Post("Post 2", "https://example.com/2", date(2025, 9, 7), "RFC")
-        ]
-        self.mock_repository.load_latest.return_value = (mock_posts, {})
-
-        # Act - This test would require full implementation of execute_with_filters
-        # For now, we test that the method exists
-        self.assertTrue(hasattr(self.use_case, 'execute_with_filters'))
-
-
-if __name__ == '__main__':
-    unittest.main()
+from src.application.dto.post_dto import ResultDTO
+
+# Posts returned by the mocked repository, built once for the module
+MOCK_POSTS = (
+    Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source A"),
+    Post("Post 2", "https://example.com/2", date(2025, 9, 7), "Source B"),
+)
+
+# Building a spec'd Mock introspects the spec: it is built once and reset
+# for each test (copies would share their child mocks and call records)
+_REPOSITORY = Mock(spec=PostRepository)
+
+
+@pytest.fixture
+def mock_repository():
+    """Mocked post repository, reset before each test"""
+    _REPOSITORY.reset_mock(return_value=True, side_effect=True)
+    return _REPOSITORY
+
+
+@pytest.fixture
+def use_case(mock_repository):
+    """LoadDataUseCase wired to the mocked repository"""
+    return LoadDataUseCase(mock_repository)
+
+
+def test_load_latest_success(mock_repository, use_case):
+    """Test loading latest data successfully"""
+    # Arrange
+    mock_metadata = {"timestamp": "2025-09-08T10:00:00", "sources": 2}
+    mock_repository.load_latest.return_value = (list(MOCK_POSTS), mock_metadata)
+
+    # Act
+    result = use_case.load_latest()
+
+    # Assert
+    assert isinstance(result, ResultDTO)
+    assert len(result.posts) == 2
+    assert result.total_count == 2
+    assert result.metadata == mock_metadata
+    mock_repository.load_latest.assert_called_once()
+
+
+def test_load_latest_empty_result(mock_repository, use_case):
+    """Test loading with empty result"""
+    # Arrange
+    mock_repository.load_latest.return_value = ([], {})
+
+    # Act
+    result = use_case.load_latest()
+
+    # Assert
+    assert len(result.posts) == 0
+    assert result.total_count == 0
+    assert result.metadata == {}
+
+
+def test_execute_with_filters_exists():
+    """Test that the filtered load is exposed by the use case"""
+    assert callable(getattr(LoadDataUseCase, 'execute_with_filters', None))
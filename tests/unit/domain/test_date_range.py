@@ -1,111 +1,77 @@
 """
 Unit tests for DateRange value object - DDD Hexagonal Architecture
 """
-import unittest
+import pytest
 from datetime import date, timedelta
+from src.domain.value_objects import date_range as date_range_module
 from src.domain.value_objects.date_range import DateRange
 
+# Frozen "today": results do not depend on the clock, even across midnight
+TODAY = date(2025, 9, 8)
+_EXPECTED_START = {days: TODAY - timedelta(days=days) for days in (0, 7, 30)}
 
-class TestDateRange(unittest.TestCase):
-    """Tests for DateRange value object"""
 
-    def test_creation_with_dates(self):
-        """Test creation with explicit dates"""
-        start = date(2025, 9, 1)
-        end = date(2025, 9, 8)
+class _FrozenDate(date):
+    """date whose today() is TODAY"""
 
-        date_range = DateRange(start_date=start, end_date=end)
+    @classmethod
+    def today(cls):
+        return TODAY
 
-        self.assertEqual(date_range.start_date, start)
-        self.assertEqual(date_range.end_date, end)
 
-    def test_from_days_back_zero(self):
-        """Test creation with 0 days (today only)"""
-        today = date.today()
-        date_range = DateRange.from_days_back(0)
+@pytest.fixture(scope="module", autouse=True)
+def frozen_today():
+    """Freeze date.today() in the date_range module for the whole test module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(date_range_module, 'date', _FrozenDate)
+        yield
 
-        self.assertEqual(date_range.start_date, today)
-        self.assertEqual(date_range.end_date, today)
 
-    def test_from_days_back_seven(self):
-        """Test creation with 7 days back"""
-        today = date.today()
-        expected_start = today - timedelta(days=7)
+def test_creation_with_dates():
+    """Test creation with explicit dates"""
+    start = date(2025, 9, 1)
+    end = date(2025, 9, 8)
 
-        date_range = DateRange.from_days_back(7)
+    date_range = DateRange(start_date=start, end_date=end)
 
-        self.assertEqual(date_range.start_date, expected_start)
-        self.assertEqual(date_range.end_date, today)
+    assert date_range.start_date == start
+    assert date_range.end_date == end
 
-    def test_from_days_back_thirty(self):
-        """Test creation with 30 days back"""
-        today = date.today()
-        expected_start = today - timedelta(days=30)
 
-        date_range = DateRange.from_days_back(30)
+@pytest.mark.parametrize("days", [0, 7, 30])
+def test_from_days_back(days):
+    """Test creation with 0 days (today only), 7 and 30 days back"""
+    date_range = DateRange.from_days_back(days)
 
-        self.assertEqual(date_range.start_date, expected_start)
-        self.assertEqual(date_range.end_date, today)
+    assert date_range.start_date == _EXPECTED_START[days]
+    assert date_range.end_date == TODAY
 
-    def test_contains_date_in_range(self):
-        """Test if a date is within the range"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
 
-        test_date = date(2025, 9, 5)
-        self.assertTrue(date_range.contains(test_date))
+@pytest.fixture(scope="module")
+def september_range():
+    """Range from 2025-09-01 to 2025-09-10 (immutable, shared by the module)"""
+    return DateRange(start_date=date(2025, 9, 1), end_date=date(2025, 9, 10))
 
-    def test_contains_date_start_boundary(self):
-        """Test start boundary date"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
 
-        self.assertTrue(date_range.contains(date(2025, 9, 1)))
+@pytest.mark.parametrize("check_date,expected", [
+    (date(2025, 9, 5), True),    # In range
+    (date(2025, 9, 1), True),    # Start boundary
+    (date(2025, 9, 10), True),   # End boundary
+    (date(2025, 8, 31), False),  # Before the range
+    (date(2025, 9, 11), False),  # After the range
+])
+def test_contains(september_range, check_date, expected):
+    """Test if a date is within the range, boundaries included"""
+    assert september_range.contains(check_date) is expected
 
-    def test_contains_date_end_boundary(self):
-        """Test end boundary date"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
 
-        self.assertTrue(date_range.contains(date(2025, 9, 10)))
+def test_str_representation():
+    """Test string representation"""
+    date_range = DateRange(
+        start_date=date(2025, 9, 1),
+        end_date=date(2025, 9, 10)
+    )
 
-    def test_contains_date_before_range(self):
-        """Test date before the range"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
-
-        test_date = date(2025, 8, 31)
-        self.assertFalse(date_range.contains(test_date))
-
-    def test_contains_date_after_range(self):
-        """Test date after the range"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
-
-        test_date = date(2025, 9, 11)
-        self.assertFalse(date_range.contains(test_date))
-
-    def test_str_representation(self):
-        """Test string representation"""
-        date_range = DateRange(
-            start_date=date(2025, 9, 1),
-            end_date=date(2025, 9, 10)
-        )
-
-        result = str(date_range)
-        expected = "2025-09-01  2025-09-10"
-        self.assertEqual(result, expected)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    result = str(date_range)
+    expected = "2025-09-01  2025-09-10"
+    assert result == expected
@@ -1,77 +1,98 @@
 """
 Unit tests for Post entity - DDD Hexagonal Architecture
 """
-import unittest
+import pickle
+from dataclasses import fields
 from datetime import date
 from src.domain.entities.post import Post
 
+# Expected to_dict() results, shared by the serialization tests
+_EXPECTED_FULL = {
+    'title': 'Test',
+    'url': 'https://example.com',
+    'date': '2025-09-08',
+    'source': 'Test Source',
+    'description': None
+}
+_EXPECTED_MINIMAL = {
+    'title': 'Test',
+    'url': 'https://example.com',
+    'date': None,
+    'source': None,
+    'description': None
+}
 
-class TestPost(unittest.TestCase):
-    """Tests for Post entity"""
-
-    def test_post_creation_minimal(self):
-        """Test creating a post with minimal fields"""
-        post = Post(title="Test Post", url="https://example.com")
-
-        self.assertEqual(post.title, "Test Post")
-        self.assertEqual(post.url, "https://example.com")
-        self.assertIsNone(post.date)
-        self.assertIsNone(post.source)
-        self.assertIsNone(post.description)
-
-    def test_post_creation_complete(self):
-        """Test creating a post with all fields"""
-        test_date = date(2025, 9, 8)
-        post = Post(
-            title="Complete Article",
-            url="https://example.com/article",
-            date=test_date,
-            source="Test Source",
-            description="Test description"
-        )
-
-        self.assertEqual(post.title, "Complete Article")
-        self.assertEqual(post.url, "https://example.com/article")
-        self.assertEqual(post.date, test_date)
-        self.assertEqual(post.source, "Test Source")
-        self.assertEqual(post.description, "Test description")
-
-    def test_to_dict_with_date(self):
-        """Test conversion to dictionary with date"""
-        test_date = date(2025, 9, 8)
-        post = Post(
-            title="Test",
-            url="https://example.com",
-            date=test_date,
-            source="Test Source"
-        )
-
-        result = post.to_dict()
-        expected = {
-            'title': 'Test',
-            'url': 'https://example.com',
-            'date': '2025-09-08',
-            'source': 'Test Source',
-            'description': None
-        }
-
-        self.assertEqual(result, expected)
-
-    def test_to_dict_without_date(self):
-        """Test conversion to dictionary without date"""
-        post = Post(title="Test", url="https://example.com")
-
-        result = post.to_dict()
-        expected = {
-            'title': 'Test',
-            'url': 'https://example.com',
-            'date': None,
-            'source': None,
-            'description': None
-        }
-
-        self.assertEqual(result, expected)
-
-
-if __name__ == '__main__':
-    unittest.main()
+
+def test_post_creation_minimal():
+    """Test creating a post with minimal fields"""
+    post = Post(title="Test Post", url="https://example.com")
+
+    assert post.title == "Test Post"
+    assert post.url == "https://example.com"
+    assert post.date is None
+    assert post.source is None
+    assert post.description is None
+
+
+def test_post_creation_complete():
+    """Test creating a post with all fields"""
+    test_date = date(2025, 9, 8)
+    post = Post(
+        title="Complete Article",
+        url="https://example.com/article",
+        date=test_date,
+        source="Test Source",
+        description="Test description"
+    )
+
+    assert post.title == "Complete Article"
+    assert post.url == "https://example.com/article"
+    assert post.date == test_date
+    assert post.source == "Test Source"
+    assert post.description == "Test description"
+
+
+def test_to_dict_with_date():
+    """Test conversion to dictionary with date"""
+    test_date = date(2025, 9, 8)
+    post = Post(
+        title="Test",
+        url="https://example.com",
+        date=test_date,
+        source="Test Source"
+    )
+
+    assert post.to_dict() == _EXPECTED_FULL
+
+
+def test_to_dict_without_date():
+    """Test conversion to dictionary without date"""
+    post = Post(title="Test", url="https://example.com")
+
+    assert post.to_dict() == _EXPECTED_MINIMAL
+
+
+def test_post_uses_slots():
+    """Test that posts store their fields in slots, without an instance __dict__"""
+    post = Post(title="Test Post", url="https://example.com")
+
+    assert {'title', 'url', 'date', 'source', 'description'} <= set(Post.__slots__)
+    assert not hasattr(post, '__dict__')
+
+
+def test_post_hash_and_equality_with_slots():
+    """Test that title/URL identity still works on slotted posts"""
+    post = Post(title="Test Post", url="https://example.com", source="A")
+    same = Post(title="Test Post", url="https://example.com", source="B")
+
+    assert post == same
+    assert len({post, same}) == 1
+
+
+def test_post_hash_is_title_url_hash():
+    """Test that the hash only depends on title and URL, with no extra dataclass field"""
+    post = Post(title="Test Post", url="https://example.com")
+
+    assert hash(post) == hash(("Test Post", "https://example.com"))
+    assert [f.name for f in fields(Post)] == ['title', 'url', 'date', 'source', 'description']
+    assert pickle.loads(pickle.dumps(post)) in {post}
@@ -1,113 +1,176 @@
 """
 Unit tests for Post domain services - DDD Hexagonal Architecture
 """
-import unittest
-from unittest.mock import Mock
-from datetime import date, timedelta
+import pytest
+from datetime import date
 from src.domain.entities.post import Post
 from src.domain.value_objects.date_range import DateRange
 from src.domain.services.post_service import PostFilteringService, PostAnalysisService
 
 
-class TestPostFilteringService(unittest.TestCase):
-    """Tests for post filtering service"""
+def _mk(i, src, d=None):
+    """Build post number i of source src"""
+    return Post(f"Post {i}", f"http://example.com/{i}", d, src)
 
-    def setUp(self):
-        self.service = PostFilteringService()
-        self.posts = [
-            Post("Post 1", "http://example.com/1", date(2025, 9, 8), "Source A"),
-            Post("Post 2", "http://example.com/2", date(2025, 9, 7), "Source B"),
-            Post("Post 3", "http://example.com/3", date(2025, 9, 6), "Source A"),
-            Post("Post 4", "http://example.com/4", None, "Source C"),  # Without date
-        ]
 
-    def test_filter_by_date_range(self):
-        """Test filtering by date range"""
-        date_range = DateRange(date(2025, 9, 7), date(2025, 9, 8))
+# Posts are immutable: the same sample is shared by every test of the module
+SAMPLE_POSTS = (
+    _mk(1, "Source A", date(2025, 9, 8)),
+    _mk(2, "Source B", date(2025, 9, 7)),
+    _mk(3, "Source A", date(2025, 9, 6)),
+    _mk(4, "Source C"),  # Without date
+)
 
-        result = self.service.filter_by_date_range(self.posts, date_range)
 
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].title, "Post 1")
-        self.assertEqual(result[1].title, "Post 2")
+@pytest.fixture(scope="module")
+def posts():
+    """Sample posts, one of them without date"""
+    return SAMPLE_POSTS
 
-    def test_filter_by_date_range_excludes_none_dates(self):
-        """Test that filtering excludes posts without dates"""
-        date_range = DateRange(date(2025, 9, 1), date(2025, 9, 10))
 
-        result = self.service.filter_by_date_range(self.posts, date_range)
+@pytest.fixture(scope="module")
+def filtering_service():
+    """Post filtering service (stateless, shared by the module)"""
+    return PostFilteringService()
 
-        # Should not include post without date
-        self.assertEqual(len(result), 3)
-        for post in result:
-            self.assertIsNotNone(post.date)
 
-    def test_filter_by_source(self):
-        """Test filtering by source"""
-        result = self.service.filter_by_source(self.posts, "Source A")
+@pytest.fixture(scope="module")
+def analysis_service():
+    """Post analysis service (stateless, shared by the module)"""
+    return PostAnalysisService()
 
-        self.assertEqual(len(result), 2)
-        for post in result:
-            self.assertEqual(post.source, "Source A")
 
-    def test_filter_by_source_not_found(self):
-        """Test filtering by non-existent source"""
-        result = self.service.filter_by_source(self.posts, "Source X")
+# Post filtering service
 
-        self.assertEqual(len(result), 0)
+@pytest.mark.parametrize("date_range,expected_titles", [
+    (DateRange(date(2025, 9, 7), date(2025, 9, 8)), ["Post 1", "Post 2"]),
+    # Posts without date are excluded
+    (DateRange(date(2025, 9, 1), date(2025, 9, 10)), ["Post 1", "Post 2", "Post 3"]),
+])
+def test_filter_by_date_range(filtering_service, posts, date_range, expected_titles):
+    """Test filtering by date range"""
+    result = filtering_service.filter_by_date_range(posts, date_range)
 
+    assert [post.title for post in result] == expected_titles
 
-class TestPostAnalysisService(unittest.TestCase):
-    """Tests for post analysis service"""
 
-    def setUp(self):
-        self.service = PostAnalysisService()
-        self.posts = [
-            Post("Post 1", "http://example.com/1", date(2025, 9, 8), "Source A"),
-            Post("Post 2", "http://example.com/2", date(2025, 9, 7), "Source B"),
-            Post("Post 3", "http://example.com/3", date(2025, 9, 6), "Source A"),
-            Post("Post 4", "http://example.com/4", None, "Source C"),
-        ]
+@pytest.mark.parametrize("source,expected_count", [
+    ("Source A", 2),
+    ("Source X", 0),  # Non-existent source
+])
+def test_filter_by_source(filtering_service, posts, source, expected_count):
+    """Test filtering by source"""
+    result = filtering_service.filter_by_source(posts, source)
 
-    def test_count_by_source(self):
-        """Test counting by source"""
-        result = self.service.count_by_source(self.posts)
+    assert len(result) == expected_count
+    assert all(post.source == source for post in result)
 
-        expected = {
-            "Source A": 2,
-            "Source B": 1,
-            "Source C": 1
-        }
-        self.assertEqual(result, expected)
 
-    def test_count_by_date(self):
-        """Test counting by date"""
-        result = self.service.count_by_date(self.posts)
+# Post analysis service
 
-        expected = {
-            date(2025, 9, 8): 1,
-            date(2025, 9, 7): 1,
-            date(2025, 9, 6): 1
-        }
-        self.assertEqual(result, expected)
+def test_count_by_source(analysis_service, posts):
+    """Test counting by source"""
+    result = analysis_service.count_by_source(posts)
 
-    def test_get_latest_posts(self):
-        """Test getting the most recent posts"""
-        result = self.service.get_latest_posts(self.posts, limit=2)
+    expected = {
+        "Source A": 2,
+        "Source B": 1,
+        "Source C": 1
+    }
+    assert result == expected
 
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].date, date(2025, 9, 8))
-        self.assertEqual(result[1].date, date(2025, 9, 7))
 
-    def test_get_latest_posts_excludes_none_dates(self):
-        """Test that posts without dates are excluded from sorting"""
-        result = self.service.get_latest_posts(self.posts, limit=10)
+def test_count_by_date(analysis_service, posts):
+    """Test counting by date"""
+    result = analysis_service.count_by_date(posts)
 
-        # Should not include post without date
-        self.assertEqual(len(result), 3)
-        for post in result:
-            self.assertIsNotNone(post.date)
+    expected = {
+        date(2025, 9, 8): 1,
+        date(2025, 9, 7): 1,
+        date(2025, 9, 6): 1
+    }
+    assert result == expected
 
 
-if __name__ == '__main__':
-    unittest.main()
+def test_get_latest_posts(analysis_service, posts):
+    """Test getting the most recent posts"""
+    result = analysis_service.get_latest_posts(posts, limit=2)
+
+    assert len(result) == 2
+    assert result[0].date == date(2025, 9, 8)
+    assert result[1].date == date(2025, 9, 7)
+
+
+def test_get_latest_posts_excludes_none_dates(analysis_service, posts):
+    """Test that posts without dates are excluded from sorting"""
+    result = analysis_service.get_latest_posts(posts, limit=10)
+
+    # Should not include post without date
+    assert len(result) == 3
+    for post in result:
+        assert post.date is not None
+
+
+def test_count_new_posts(analysis_service, posts):
+    """Test counting posts absent from a previous list, each duplicate counted"""
+    current = [
+        *posts,
+        _mk(5, "Source A", date(2025, 9, 9)),
+        _mk(5, "Source A", date(2025, 9, 9)),
+    ]
+
+    assert analysis_service.count_new_posts(current, posts) == 2
+    assert analysis_service.count_new_posts(posts, []) == 4
+
+
+def test_summarize_posts(analysis_service):
+    """Test sorted distinct sources and earliest/latest dates"""
+    posts = [
+        Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Reddit"),
+        Post("Post 2", "https://example.com/2", None, "Korben"),
+        Post("Post 3", "https://example.com/3", date(2025, 9, 1), "Reddit"),
+        Post("Post 4", "https://example.com/4", date(2025, 9, 5), None),
+    ]
+
+    assert analysis_service.summarize_posts(posts) == (["Korben", "Reddit"], date(2025, 9, 1), date(2025, 9, 8))
+
+
+def test_summarize_posts_no_posts(analysis_service):
+    """Test that an empty list has no sources nor dates"""
+    assert analysis_service.summarize_posts([]) == ([], None, None)
+
+
+# Volume tests: pin the counting and sorting results on large inputs
+
+_SOURCES = ("Source A", "Source B", "Source C")
+_VOLUMES = [10, pytest.param(10_000, marks=pytest.mark.slow)]
+
+
+def _synthetic_posts(n):
+    """n posts spread over the sample sources and 30 days of September 2025, one in ten undated"""
+    return [
+        _mk(i, _SOURCES[i % len(_SOURCES)], None if i % 10 == 9 else date(2025, 9, 1 + i % 30))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n", _VOLUMES)
+def test_count_by_source_volume(analysis_service, n):
+    """Test that counts by source cover every post"""
+    result = analysis_service.count_by_source(_synthetic_posts(n))
+
+    assert sum(result.values()) == n
+    assert set(result) == set(_SOURCES)
+
+
+@pytest.mark.parametrize("n", _VOLUMES)
+def test_count_by_date_and_latest_volume(analysis_service, filtering_service, n):
+    """Test counts by date, date filtering and latest posts on the same volume"""
+    posts = _synthetic_posts(n)
+    dated = [post for post in posts if post.date is not None]
+
+    assert sum(analysis_service.count_by_date(posts).values()) == len(dated)
+    assert len(filtering_service.filter_by_date_range(posts, DateRange(date(2025, 9, 1), date(2025, 9, 30)))) == len(dated)
+
+    latest = analysis_service.get_latest_posts(posts, limit=5)
+    assert [post.date for post in latest] == sorted((post.date for post in dated), reverse=True)[:5]
@@ -0,0 +1,85 @@
+"""
+Unit tests for source crawlers - DDD Hexagonal Architecture
+"""
+import pytest
+from unittest.mock import Mock, patch
+from datetime import date
+from src.domain.value_objects.date_range import DateRange
+from src.infrastructure.adapters.base_crawler import CRAWLER_REGISTRY, register_crawler
+from src.infrastructure.adapters.technical_adapters import RateLimiter
+from src.infrastructure.factories.crawler_factory import CrawlerFactory
+from src.infrastructure.external.crawlers.korben_crawler import KorbenCrawler
+from src.infrastructure.external.crawlers.reddit_php_rss_crawler import RedditPhpRssCrawler
+
+SEPTEMBER_RANGE = DateRange(date(2025, 9, 1), date(2025, 9, 10))
+
+
+def _rss_feed(*items):
+    """RSS document with one <item> per (title, pubDate) pair"""
+    return "<rss><channel>" + "".join(
+        f"<item><title>{title}</title><link>https://example.com/{i}</link><pubDate>{pub_date}</pubDate></item>"
+        for i, (title, pub_date) in enumerate(items)
+    ) + "</channel></rss>"
+
+
+def _crawler(crawler_class, feed):
+    """Crawler whose HTTP client returns the given feed, without request rate limit"""
+    http_client = Mock()
+    http_client.get.return_value = Mock(text=feed)
+    crawler = crawler_class(http_client=http_client)
+    crawler._limiter = RateLimiter(max_rate=1000)
+    return crawler
+
+
+def test_korben_keeps_in_range_items_after_an_older_one():
+    """Test that an out-of-order older item does not hide the in-range items after it"""
+    crawler = _crawler(KorbenCrawler, _rss_feed(
+        ("Recent", "Mon, 08 Sep 2025 10:00:00 +0000"),
+        ("Republished", "Fri, 01 Aug 2025 10:00:00 +0000"),
+        ("Also recent", "Fri, 05 Sep 2025 10:00:00 +0000"),
+        ("Future", "Sat, 20 Sep 2025 10:00:00 +0000"),
+    ))
+
+    posts = crawler.fetch_posts_in_range(SEPTEMBER_RANGE)
+
+    assert [(post.title, post.date) for post in posts] == [
+        ("Recent", date(2025, 9, 8)),
+        ("Also recent", date(2025, 9, 5)),
+    ]
+
+
+@pytest.mark.parametrize("crawler_class", [KorbenCrawler, RedditPhpRssCrawler])
+def test_malformed_item_does_not_empty_the_feed(crawler_class):
+    """Test that an item failing to parse is skipped while the others are kept"""
+    crawler = _crawler(crawler_class, _rss_feed(
+        ("First", "Mon, 08 Sep 2025 10:00:00 +0000"),
+        ("Malformed", "Sun, 07 Sep 2025 10:00:00 +0000"),
+        ("Last", "Fri, 05 Sep 2025 10:00:00 +0000"),
+    ))
+    extract_date = crawler._extract_date
+
+    def failing_extract_date(item):
+        if item.findtext("title") == "Malformed":
+            raise ValueError("unparsable item")
+        return extract_date(item)
+
+    with patch.object(crawler, '_extract_date', side_effect=failing_extract_date):
+        posts = crawler.fetch_posts_in_range(SEPTEMBER_RANGE)
+
+    assert [post.title for post in posts] == ["First", "Last"]
+
+
+def test_factory_returns_every_registered_crawler():
+    """Test that importing the crawlers package registers both sources for the factory"""
+    crawlers = CrawlerFactory.get_all_crawlers()
+
+    assert [type(crawler) for crawler in crawlers] == [KorbenCrawler, RedditPhpRssCrawler]
+    assert CrawlerFactory.get_available_sources() == ["Korben Blog", "r/PHP"]
+
+
+def test_register_crawler_twice_keeps_a_single_entry():
+    """Test that registering an already registered class returns it and leaves the registry unchanged"""
+    registry = list(CRAWLER_REGISTRY)
+
+    assert register_crawler(KorbenCrawler) is KorbenCrawler
+    assert CRAWLER_REGISTRY == registry
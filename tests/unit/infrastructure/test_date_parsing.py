@@ -0,0 +1,40 @@
+"""
+Unit tests for feed date parsing - DDD Hexagonal Architecture
+"""
+import unittest
+from datetime import date
+from src.infrastructure.adapters.date_parsing import parse_feed_date
+
+
+class TestParseFeedDate(unittest.TestCase):
+    """Tests for the shared RSS/Atom date parser"""
+
+    def test_rfc2822_with_timezone(self):
+        """Test standard RSS date"""
+        self.assertEqual(parse_feed_date("Thu, 05 Sep 2025 10:14:03 +0000"), date(2025, 9, 5))
+
+    def test_rfc2822_without_weekday(self):
+        """Test RSS date without weekday nor timezone"""
+        self.assertEqual(parse_feed_date("05 Sep 2025 10:14:03"), date(2025, 9, 5))
+
+    def test_iso_datetime(self):
+        """Test Atom dates with UTC designator and offset"""
+        self.assertEqual(parse_feed_date("2025-09-05T10:14:03Z"), date(2025, 9, 5))
+        self.assertEqual(parse_feed_date("2025-09-05T10:14:03+02:00"), date(2025, 9, 5))
+
+    def test_date_only(self):
+        """Test plain ISO date fallback"""
+        self.assertEqual(parse_feed_date("2025-09-05"), date(2025, 9, 5))
+
+    def test_unrecognized_format(self):
+        """Test that unknown formats return None"""
+        self.assertIsNone(parse_feed_date("yesterday"))
+        self.assertIsNone(parse_feed_date("05 Foo 2025 10:14:03"))
+
+    def test_invalid_calendar_date(self):
+        """Test that out-of-range values return None"""
+        self.assertIsNone(parse_feed_date("2025-02-30"))
+
+
+if __name__ == '__main__':
+    unittest.main()
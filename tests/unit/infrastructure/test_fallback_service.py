@@ -0,0 +1,77 @@
+"""
+Unit tests for the fallback verification service - DDD Hexagonal Architecture
+"""
+import unittest
+from unittest.mock import Mock
+from datetime import date, timedelta
+from src.domain.entities.post import Post
+from src.domain.value_objects.date_range import DateRange
+from src.infrastructure.services.fallback_service import FallbackVerificationService
+
+
+class TestAnalyzeParsingQuality(unittest.TestCase):
+    """Tests for parsed posts quality analysis"""
+
+    def setUp(self):
+        self.service = FallbackVerificationService()
+
+    def test_clean_posts_keep_full_score(self):
+        """Test that well-formed posts report no issue"""
+        posts = [Post("A long enough title", "https://example.com/1", date(2025, 9, 8), "Source")]
+
+        analysis = self.service.analyze_parsing_quality(None, posts)
+
+        self.assertEqual(analysis['quality_score'], 1.0)
+        self.assertEqual(analysis['issues'], [])
+
+    def test_issues_are_counted(self):
+        """Test that each kind of issue is counted and weighted"""
+        posts = [
+            Post("A long enough title", "https://example.com/1", date(2025, 9, 8), "Source"),
+            Post("Short", "/relative", None, "Source"),
+        ]
+
+        analysis = self.service.analyze_parsing_quality(None, posts)
+
+        self.assertEqual(analysis['issues'], [
+            "1/2 posts without date",
+            "1/2 posts with invalid URLs",
+            "1/2 posts with very short titles",
+        ])
+        self.assertAlmostEqual(analysis['quality_score'], 0.5)
+
+
+class TestCheckForMissedPosts(unittest.TestCase):
+    """Tests for missed posts detection"""
+
+    def setUp(self):
+        self.service = FallbackVerificationService()
+        self.crawler = Mock(source_name="Source")
+        self.crawler.fetch_recent_posts_for_fallback.return_value = []
+        today = date.today()
+        self.date_range = DateRange(today - timedelta(days=2), today)
+
+    def test_stale_most_recent_post(self):
+        """Test alert when the most recent post is several days old"""
+        posts = [
+            Post("Old post", "https://example.com/1", date.today() - timedelta(days=10), "Source"),
+            Post("Older post", "https://example.com/2", date.today() - timedelta(days=12), "Source"),
+        ]
+
+        result = self.service.check_for_missed_posts(self.crawler, self.date_range, posts)
+
+        self.assertTrue(result['has_alert'])
+        self.assertIn("10 days old", result['alert_message'])
+
+    def test_posts_without_dates_do_not_error(self):
+        """Test that posts without any date skip the recency check"""
+        posts = [Post("Undated post", "https://example.com/1", None, "Source")]
+
+        result = self.service.check_for_missed_posts(self.crawler, self.date_range, posts)
+
+        self.assertFalse(result['has_alert'])
+        self.assertEqual(result['confidence_score'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
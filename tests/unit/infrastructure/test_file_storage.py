@@ -0,0 +1,89 @@
+"""
+Unit tests for atomic file writes - DDD Hexagonal Architecture
+"""
+import os
+import stat
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+from src.infrastructure.adapters import file_storage
+from src.infrastructure.adapters.file_storage import atomic_open, atomic_write, ensure_directory
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for temp-file + rename writes"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "data.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_atomic_write_replaces_content(self):
+        """Test that the target ends up with the new payload only"""
+        self.path.write_bytes(b"old content")
+
+        atomic_write(self.path, b"new")
+
+        self.assertEqual(self.path.read_bytes(), b"new")
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [self.path])
+
+    def test_atomic_write_file_mode(self):
+        """Test that new files follow the umask and replaced files keep their mode"""
+        atomic_write(self.path, b"new")
+        self.assertEqual(stat.S_IMODE(self.path.stat().st_mode), 0o666 & ~file_storage._process_umask())
+
+        self.path.chmod(0o640)
+        atomic_write(self.path, b"newer")
+        self.assertEqual(stat.S_IMODE(self.path.stat().st_mode), 0o640)
+
+    def test_read_umask_leaves_umask_unchanged(self):
+        """Test reading the umask from /proc and from the probe-file fallback"""
+        previous = os.umask(0o027)
+        try:
+            self.assertEqual(file_storage._read_umask(), 0o027)
+            with patch('builtins.open', side_effect=OSError):
+                self.assertEqual(file_storage._read_umask(), 0o027)
+            self.assertEqual(os.umask(0o027), 0o027)
+        finally:
+            os.umask(previous)
+
+    def test_failed_write_keeps_original(self):
+        """Test that an error during the write leaves the target untouched"""
+        self.path.write_bytes(b"original")
+
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.path) as f:
+                f.write(b"partial")
+                raise RuntimeError("crash")
+
+        self.assertEqual(self.path.read_bytes(), b"original")
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [self.path])
+
+
+class TestEnsureDirectory(unittest.TestCase):
+    """Tests for once-per-process directory creation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_directory_created_once(self):
+        """Test that the directory is created, then mkdir is skipped"""
+        path = Path(self.temp_dir) / "var" / "saves"
+
+        ensure_directory(path)
+        self.assertTrue(path.is_dir())
+
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            ensure_directory(path)
+            mock_mkdir.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
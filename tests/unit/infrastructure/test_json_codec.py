@@ -0,0 +1,45 @@
+"""
+Unit tests for the JSON codec - DDD Hexagonal Architecture
+"""
+import unittest
+from unittest.mock import patch
+from datetime import date
+from src.domain.entities.post import Post
+from src.infrastructure.adapters import json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Tests for orjson-backed JSON helpers and their stdlib fallback"""
+
+    def test_round_trip(self):
+        """Test encoding then decoding a config-like document"""
+        data = {'name': 'korben', 'enabled': False, 'timeout': 10}
+
+        self.assertEqual(json_codec.loads(json_codec.dumps(data)), data)
+        self.assertEqual(json_codec.loads(json_codec.dumps(data, indent=True)), data)
+
+    def test_stdlib_fallback_matches_orjson(self):
+        """Test that the json fallback produces the same document, dates included"""
+        data = {'title': 'Café', 'date': date(2025, 9, 8)}
+        expected = json_codec.loads(json_codec.dumps(data))
+
+        with patch.object(json_codec, 'ORJSON_AVAILABLE', False):
+            encoded = json_codec.dumps(data)
+            self.assertEqual(json_codec.loads(encoded), expected)
+        self.assertEqual(expected, {'title': 'Café', 'date': '2025-09-08'})
+
+    def test_dataclasses_and_newline(self):
+        """Test that Post entities encode like to_dict(), with both encoders"""
+        post = Post("Café", "https://example.com", date(2025, 9, 8), "Source")
+
+        encoded = json_codec.dumps([post], newline=True)
+        with patch.object(json_codec, 'ORJSON_AVAILABLE', False):
+            fallback = json_codec.dumps([post], newline=True)
+
+        for payload in (encoded, fallback):
+            self.assertTrue(payload.endswith(b']\n'))
+            self.assertEqual(json_codec.loads(payload), [post.to_dict()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,55 +1,294 @@
 """
 Unit tests for JSON Post Repository - DDD Hexagonal Architecture
 """
-import unittest
-from unittest.mock import Mock, patch, mock_open
+import pytest
+from unittest.mock import patch
 import json
-import tempfile
+import os
 import shutil
-from datetime import date
-from pathlib import Path
+from datetime import date, timedelta
 from src.domain.entities.post import Post
-from src.infrastructure.repositories.json_post_repository import JsonPostRepository
+from src.infrastructure.repositories.json_post_repository import JsonPostRepository, title_url_digest
 
 
-class TestJsonPostRepository(unittest.TestCase):
-    """Tests for JSON implementation of Post repository"""
+@pytest.fixture(autouse=True)
+def no_fsync(monkeypatch):
+    """Skip disk flushes: durability is not under test and fsync dominates the I/O cost"""
+    monkeypatch.setattr(os, 'fsync', lambda fd: None)
 
-    def setUp(self):
-        """Test setup with temporary directory and unified database file"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "techwatch_db.json"
-        self.repository = JsonPostRepository(db_path=str(self.db_path))
 
-    def tearDown(self):
-        """Cleanup temporary files"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+@pytest.fixture
+def db_path(tmp_path):
+    """Unified database file in a per-test temporary directory"""
+    return tmp_path / "techwatch_db.json"
 
-    def test_save_posts_success(self):
-        """Test successful posts saving to unified database"""
-        posts = [
-            Post("Test Post", "https://example.com", date(2025, 9, 8), "Test Source")
+
+@pytest.fixture
+def repository(db_path):
+    """Repository on an empty database"""
+    return JsonPostRepository(db_path=str(db_path))
+
+
+@pytest.fixture(scope="session")
+def golden_database(tmp_path_factory):
+    """Database directory populated once per session through the repository save path"""
+    directory = tmp_path_factory.mktemp("golden")
+    JsonPostRepository(db_path=str(directory / "techwatch_db.json")).save([
+        Post("Test Post", "https://example.com", date(2025, 9, 8), "Test Source")
+    ])
+    return directory
+
+
+@pytest.fixture
+def populated_repository(golden_database, tmp_path):
+    """Repository on a per-test copy of the golden database"""
+    directory = shutil.copytree(golden_database, tmp_path / "populated")
+    return JsonPostRepository(db_path=str(directory / "techwatch_db.json"))
+
+
+def test_save_posts_success(repository):
+    """Test successful posts saving to unified database"""
+    posts = [
+        Post("Test Post", "https://example.com", date(2025, 9, 8), "Test Source")
+    ]
+    success = repository.save(posts)
+    assert success
+    assert repository.shard_path("2025-09").exists()
+    assert repository.manifest_path.exists()
+    assert repository.metadata_path.exists()
+
+
+def test_generate_metadata_uses_iso_strings(repository):
+    """Test that generated metadata holds ISO strings, as read back from disk"""
+    metadata = repository._generate_metadata([
+        Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source"),
+        Post("Post 2", "https://example.com/2", date(2025, 9, 1), "Source")
+    ])
+
+    assert isinstance(metadata["generated_at"], str)
+    assert metadata["date_range"] == {"earliest": "2025-09-01", "latest": "2025-09-08", "days_range": 8}
+
+
+def test_save_appends_without_duplicates(repository, db_path):
+    """Test that successive saves append only unseen URLs"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    repository.save([
+        Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source"),
+        Post("Post 2", "https://example.com/2", date(2025, 9, 9), "Source")
+    ])
+
+    lines = repository.shard_path("2025-09").read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    loaded_posts, _ = JsonPostRepository(db_path=str(db_path)).load_latest()
+    assert [post.title for post in loaded_posts] == ["Post 1", "Post 2"]
+
+
+def test_save_uses_persistent_url_index(repository, db_path):
+    """Test that a new repository instance dedups from the URL index"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    assert repository.urls_index_path.read_text(encoding='utf-8').splitlines() == ["https://example.com/1"]
+
+    other_repository = JsonPostRepository(db_path=str(db_path))
+    other_repository.save([
+        Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source"),
+        Post("Post 2", "https://example.com/2", date(2025, 9, 9), "Source")
+    ])
+
+    assert repository.urls_index_path.read_text(encoding='utf-8').splitlines() == [
+        "https://example.com/1", "https://example.com/2"
+    ]
+    assert len(repository.shard_path("2025-09").read_text(encoding='utf-8').splitlines()) == 2
+
+
+def test_save_shards_by_month(repository, db_path):
+    """Test that posts are appended to the shard of their month"""
+    repository.save([
+        Post("September", "https://example.com/1", date(2025, 9, 8), "Source"),
+        Post("Undated", "https://example.com/2", None, "Source"),
+        Post("August", "https://example.com/3", date(2025, 8, 30), "Source")
+    ])
+
+    assert json.loads(repository.manifest_path.read_text(encoding='utf-8')) == {
+        "2025-08": "techwatch_db_2025_08.jsonl",
+        "2025-09": "techwatch_db_2025_09.jsonl",
+        "undated": "techwatch_db_undated.jsonl"
+    }
+    loaded_posts, _ = JsonPostRepository(db_path=str(db_path)).load_latest()
+    assert [post.title for post in loaded_posts] == ["August", "September", "Undated"]
+
+
+def test_load_latest_days_back_reads_recent_shards_only(repository):
+    """Test that a bounded load skips the shards of older months"""
+    today = date.today()
+    repository.save([
+        Post("Recent", "https://example.com/1", today, "Source"),
+        Post("Old", "https://example.com/2", today - timedelta(days=100), "Source"),
+        Post("Undated", "https://example.com/3", None, "Source")
+    ])
+
+    with patch.object(repository, '_iter_file_articles', wraps=repository._iter_file_articles) as mock_iter:
+        loaded_posts, _ = repository.load_latest(days_back=7)
+
+    assert [post.title for post in loaded_posts] == ["Recent"]
+    read_paths = {call.args[0] for call in mock_iter.call_args_list}
+    assert repository.shard_path(JsonPostRepository._shard_key(today - timedelta(days=100))) not in read_paths
+    assert repository.shard_path("undated") not in read_paths
+
+
+def test_save_appends_newline_terminated_lines(repository):
+    """Test that each saved article is one JSON line, across successive and large saves"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    repository.save([
+        Post(f"Post {i}", f"https://example.com/{i}/" + "x" * 200, date(2025, 9, 10), "Source")
+        for i in range(2, 1000)
+    ])
+
+    content = repository.shard_path("2025-09").read_bytes()
+    assert content.endswith(b"\n")
+    assert [json.loads(line)["title"] for line in content.splitlines()[:2]] == ["Post 1", "Post 2"]
+    loaded_posts, _ = repository.load_latest()
+    assert len(loaded_posts) == 999
+
+
+def test_iter_title_url(repository):
+    """Test streaming (title, url) pairs without building posts"""
+    repository.save([
+        Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source"),
+        Post("Post 2", "https://example.com/2", None, "Source")
+    ])
+
+    with patch.object(JsonPostRepository, '_dicts_to_posts') as mock_convert:
+        pairs = list(repository.iter_title_url())
+        mock_convert.assert_not_called()
+
+    assert pairs == [("Post 1", "https://example.com/1"), ("Post 2", "https://example.com/2")]
+
+
+def test_save_appends_to_digest_index(repository):
+    """Test that saved articles are recorded in the digest index and found without reading shards"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    repository.save([Post("Post 2", "https://example.com/2", date(2025, 9, 9), "Source")])
+    digests = {
+        title_url_digest("Post 1", "https://example.com/1"),
+        title_url_digest("Post 2", "https://example.com/2")
+    }
+
+    assert repository.digests_index_path.stat().st_size == 16
+    with patch.object(repository, 'iter_title_url') as mock_iter:
+        assert repository.find_known_digests(digests) == digests
+        mock_iter.assert_not_called()
+
+
+def test_find_known_digests(repository):
+    """Test that only the stored digests among the given ones are returned"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    stored = title_url_digest("Post 1", "https://example.com/1")
+    unknown = title_url_digest("Post 2", "https://example.com/2")
+
+    assert repository.find_known_digests({stored, unknown}) == {stored}
+    assert repository.find_known_digests(set()) == set()
+
+
+def test_find_known_digests_rebuilds_missing_index(repository):
+    """Test that a missing digest index is rebuilt from the shards"""
+    repository.save([Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")])
+    repository.digests_index_path.unlink()
+    stored = title_url_digest("Post 1", "https://example.com/1")
+
+    assert repository.find_known_digests({stored}) == {stored}
+    assert repository.digests_index_path.exists()
+
+
+def test_load_latest_file_not_exists(repository):
+    """Test loading when no file exists (should return empty)"""
+    posts, metadata = repository.load_latest()
+    assert posts == []
+    assert metadata == {}
+
+
+def test_load_latest_with_existing_file(populated_repository):
+    """Test loading from unified database when it exists"""
+    loaded_posts, metadata = populated_repository.load_latest()
+    assert len(loaded_posts) == 1
+    assert loaded_posts[0].title == "Test Post"
+    assert loaded_posts[0].url == "https://example.com"
+    assert loaded_posts[0].source == "Test Source"
+
+
+def test_load_latest_uses_cache_until_files_change(populated_repository):
+    """Test that repeated loads skip parsing until the database changes"""
+    repository = populated_repository
+    repository.load_latest()
+
+    with patch.object(repository, '_iter_articles') as mock_iter:
+        loaded_posts, _ = repository.load_latest()
+        mock_iter.assert_not_called()
+    assert len(loaded_posts) == 1
+
+    repository.save([Post("Post 2", "https://example.com/2", date(2025, 9, 9), "Source")])
+    loaded_posts, _ = repository.load_latest()
+    assert len(loaded_posts) == 2
+
+
+def test_load_latest_migrates_legacy_database(repository, db_path):
+    """Test that a legacy single-document database is converted to JSON Lines"""
+    legacy = {
+        "metadata": {"format_version": "2.0"},
+        "articles": [
+            {"title": "Old Post", "url": "https://example.com/old", "date": "2025-09-01", "source": "Legacy"}
         ]
-        success = self.repository.save(posts)
-        self.assertTrue(success)
-        self.assertTrue(self.db_path.exists())
-
-    def test_load_latest_file_not_exists(self):
-        """Test loading when no file exists (should return empty)"""
-        posts, metadata = self.repository.load_latest()
-        self.assertEqual(posts, [])
-        self.assertEqual(metadata, {})
-
-    def test_load_latest_with_existing_file(self):
-        """Test loading from unified database when it exists"""
-        posts = [Post("Test Post", "https://example.com", date(2025, 9, 8), "Test Source")]
-        self.repository.save(posts)
-        loaded_posts, metadata = self.repository.load_latest()
-        self.assertEqual(len(loaded_posts), 1)
-        self.assertEqual(loaded_posts[0].title, "Test Post")
-        self.assertEqual(loaded_posts[0].url, "https://example.com")
-        self.assertEqual(loaded_posts[0].source, "Test Source")
-
-
-if __name__ == '__main__':
-    unittest.main()
+    }
+    db_path.write_text(json.dumps(legacy), encoding='utf-8')
+
+    loaded_posts, metadata = repository.load_latest()
+
+    assert len(loaded_posts) == 1
+    assert loaded_posts[0].date == date(2025, 9, 1)
+    assert metadata == {"format_version": "2.0"}
+    assert repository.shard_path("2025-09").exists()
+    assert not db_path.exists()
+
+
+def test_load_latest_migrates_unsharded_database(repository):
+    """Test that a single JSON Lines file is split into monthly shards"""
+    repository.articles_path.write_text(
+        '{"title": "Post 1", "url": "https://example.com/1", "date": "2025-08-30", "source": "Source"}\n'
+        '{"title": "Post 2", "url": "https://example.com/2", "date": "2025-09-08", "source": "Source"}\n',
+        encoding='utf-8'
+    )
+
+    loaded_posts, _ = repository.load_latest()
+
+    assert [post.title for post in loaded_posts] == ["Post 1", "Post 2"]
+    assert repository.shard_path("2025-08").exists()
+    assert repository.shard_path("2025-09").exists()
+    assert not repository.articles_path.exists()
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("2025-09-08", date(2025, 9, 8)),
+    ("2025-09-08T10:14:03+02:00", date(2025, 9, 8)),
+    ("2025-02-30", None),  # Invalid day
+    ("not a date", None),
+    (None, None),
+])
+def test_dict_to_post_parses_dates(repository, value, expected):
+    """Test ISO dates, datetime strings and invalid dates"""
+    post = repository._dict_to_post({"title": "T", "url": "u", "date": value})
+
+    assert post.date == expected
+
+
+def test_dicts_to_posts_bulk_conversion(repository):
+    """Test bulk conversion, including shared dates and invalid records"""
+    articles = [
+        {"title": "Post 1", "url": "https://example.com/1", "date": "2025-09-08", "source": "Source"},
+        {"title": "Post 2", "url": "https://example.com/2", "date": "2025-09-08", "source": "Source"},
+        {"title": "Post 3", "url": "https://example.com/3", "date": "invalid", "source": "Source"},
+        None,
+    ]
+
+    posts = repository._dicts_to_posts(iter(articles))
+
+    assert [post.title for post in posts] == ["Post 1", "Post 2", "Post 3"]
+    assert [post.date for post in posts] == [date(2025, 9, 8), date(2025, 9, 8), None]
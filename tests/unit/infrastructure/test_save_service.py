@@ -0,0 +1,42 @@
+"""
+Unit tests for SaveService - DDD Hexagonal Architecture
+"""
+import unittest
+import tempfile
+import shutil
+import json
+from datetime import date
+from src.domain.entities.post import Post
+from src.infrastructure.services.save_service import SaveService
+
+
+class TestSaveService(unittest.TestCase):
+    """Tests for JSON saves"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = SaveService(self.temp_dir)
+        self.posts = [Post("Post 1", "https://example.com/1", date(2025, 9, 8), "Source")]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_json_is_compact_by_default(self):
+        """Test that saves are written without indentation"""
+        path = self.service.save_json(self.posts, {"format_version": "2.0"}, "save")
+
+        content = path.read_text(encoding='utf-8')
+        self.assertNotIn("\n", content)
+        self.assertEqual(json.loads(content)["articles"][0]["date"], "2025-09-08")
+
+    def test_save_json_pretty_export(self):
+        """Test that pretty exports are indented"""
+        compact = self.service.save_json(self.posts, {}, "compact")
+        pretty = self.service.save_json(self.posts, {}, "pretty", pretty=True)
+
+        self.assertIn("\n  ", pretty.read_text(encoding='utf-8'))
+        self.assertEqual(json.loads(pretty.read_bytes()), json.loads(compact.read_bytes()))
+
+
+if __name__ == '__main__':
+    unittest.main()
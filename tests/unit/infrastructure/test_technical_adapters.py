@@ -0,0 +1,66 @@
+"""
+Unit tests for technical adapters - DDD Hexagonal Architecture
+"""
+import threading
+from src.infrastructure.adapters.technical_adapters import RateLimiter
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock, with a sleep that records the requested waits"""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+def test_sequential_calls_are_spaced_by_the_interval():
+    """Test that back-to-back calls wait one more interval each"""
+    clock = _FakeClock()
+    limiter = RateLimiter(max_rate=1, time_period=2.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        with limiter:
+            pass
+
+    assert clock.sleeps == [2.0, 4.0]
+
+
+def test_concurrent_calls_get_distinct_slots():
+    """Test that threads acquiring at the same instant are given one slot each"""
+    clock = _FakeClock()
+    limiter = RateLimiter(max_rate=2, time_period=1.0, clock=clock, sleep=clock.sleep)
+    start = threading.Barrier(8)
+
+    def worker():
+        start.wait()
+        limiter.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One thread goes through immediately, the others wait 0.5s, 1s, ... 3.5s
+    assert sorted(clock.sleeps) == [0.5 * k for k in range(1, 8)]
+
+
+def test_idle_time_does_not_allow_a_burst():
+    """Test that slots unused while idle are not saved up for a later burst"""
+    clock = _FakeClock()
+    limiter = RateLimiter(max_rate=1, time_period=2.0, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+
+    clock.now += 60
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [2.0]